@@ -15,7 +15,8 @@
 
 
 from dataclasses import fields
-from typing import List, NewType, Optional, Type, TypeVar
+from functools import lru_cache
+from typing import List, NewType, Optional, Tuple, Type, TypeVar
 
 from action.errors import UserReadableException
 from sanic.request import Request
@@ -28,6 +29,39 @@ IntOpt = NewType('IntOpt', Optional[int])
 ListIntOpt = NewType('ListIntOpt', List[int])
 
 
+_STR, _STR_OPT, _LIST_STR, _LIST_STR_OPT, _INT, _INT_OPT, _LIST_INT, _LIST_INT_OPT, _BOOL = range(9)
+
+
+# Note: generic aliases (List[str] etc.) are compared by equality (via hashing),
+# as their identity is not guaranteed by the typing module
+_KINDS = {
+    str: _STR,
+    StrOpt: _STR_OPT,
+    List[str]: _LIST_STR,
+    ListStrOpt: _LIST_STR_OPT,
+    int: _INT,
+    IntOpt: _INT_OPT,
+    List[int]: _LIST_INT,
+    ListIntOpt: _LIST_INT_OPT,
+    bool: _BOOL,
+}
+
+
+@lru_cache(maxsize=None)
+def _plan_for(tp: Type) -> Tuple[Tuple[str, int], ...]:
+    """
+    Create a parsing plan for a (dataclass) Type. The plan is a tuple of (field name, value kind)
+    pairs so the type introspection is performed only once per Type. Fields of unsupported
+    types are omitted (just like create_mapped_args always did).
+    """
+    ans = []
+    for field in fields(tp):
+        kind = _KINDS.get(field.type)
+        if kind is not None:
+            ans.append((field.name, kind))
+    return tuple(ans)
+
+
 def create_mapped_args(tp: Type, req: Request):
     """
     Create an instance of a (dataclass) Type based on req arguments.
@@ -36,47 +70,46 @@ def create_mapped_args(tp: Type, req: Request):
     TODO handle Optional vs. default_factory etc.
     """
     data = {}
-    for field in fields(tp):
-        mk, mtype = field.name, field.type
-        v = req.args.getlist(mk, [])
-        if len(v) == 0:
-            v = req.form.get(mk, [])
-        if mtype == str:
+    args = req.args
+    form = req.form
+    for mk, kind in _plan_for(tp):
+        v = args.getlist(mk) or form.getlist(mk, [])
+        if kind == _STR:
             if len(v) == 0:
                 raise UserReadableException(f'Missing request argument {mk}')
             if len(v) > 1:
                 raise UserReadableException(f'Argument {mk} is cannot be multi-valued')
             data[mk] = v[0]
-        elif mtype == StrOpt:
+        elif kind == _STR_OPT:
             if len(v) > 1:
                 raise UserReadableException(f'Argument {mk} is cannot be multi-valued')
             elif len(v) == 1:
                 data[mk] = v[0]
-        elif mtype == List[str]:
+        elif kind == _LIST_STR:
             if len(v) == 0:
                 raise UserReadableException(f'Missing request argument {mk}')
             data[mk] = v
-        elif mtype == ListStrOpt:
+        elif kind == _LIST_STR_OPT:
             if len(v) > 0:
                 data[mk] = v
-        elif mtype == int:
+        elif kind == _INT:
             if len(v) == 0:
                 raise UserReadableException(f'Missing request argument {mk}')
             elif len(v) > 1:
                 raise UserReadableException(f'Argument {mk} is cannot be multi-valued')
             data[mk] = int(v[0])
-        elif mtype == IntOpt:
+        elif kind == _INT_OPT:
             if len(v) > 1:
                 raise UserReadableException(f'Argument {mk} is cannot be multi-valued')
             elif len(v) == 1:
                 data[mk] = int(v[0])
-        elif mtype == List[int]:
+        elif kind == _LIST_INT:
             if len(v) == 0:
                 raise UserReadableException(f'Missing request argument {mk}')
             data[mk] = [int(x) for x in v]
-        elif mtype == ListIntOpt:
+        elif kind == _LIST_INT_OPT:
             if len(v) > 0:
                 data[mk] = [int(x) for x in v]
-        elif mtype == bool:
+        elif kind == _BOOL:
             data[mk] = bool(int(v[0]))
     return tp(**data)
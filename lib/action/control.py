@@ -13,12 +13,13 @@
 # MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
 # GNU General Public License for more details.
 
-import json
 import logging
 import secrets
-from functools import wraps
+import traceback
+from functools import lru_cache, wraps
 from typing import Any, Callable, Coroutine, Optional, Type, Union, Tuple, Dict, Awaitable
 
+import orjson
 import settings
 from action.argmapping.action import create_mapped_args
 from action.errors import (
@@ -33,13 +34,99 @@ from action.model.user import UserActionModel
 from action.props import ActionProps
 from action.response import KResponse
 from action.result.base import BaseResult
-from action.templating import CustomJSONEncoder, ResultType, TplEngine
+from action.templating import ResultType, TplEngine, custom_json_default
 from action.theme import apply_theme
 from dataclasses_json import DataClassJsonMixin
 from sanic import HTTPResponse, Sanic, response
 from sanic.request import Request
 from templating import Type2XML
 
+_JSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATACLASS
+
+_application: Optional[Sanic] = None
+
+
+def _get_application() -> Sanic:
+    """
+    Return the 'kontext' Sanic application. The instance does not change
+    during the server lifetime so the registry lookup is done just once.
+    """
+    global _application
+    if _application is None:
+        _application = Sanic.get_app('kontext')
+    return _application
+
+
+def _raise_unsupported(result: Any, return_type: str):
+    if (isinstance(result, dict) and
+            'messages' in result and
+            any(x[0] == 'error' for x in result['messages'])):
+        raise RuntimeError(f'Exceptions occured: {result["messages"]}')
+    raise RuntimeError(
+        f'Unsupported result and return_type combination: {result.__class__.__name__},  {return_type}')
+
+
+async def _render_json(
+        app: Sanic, action_model: AbstractPageModel, action_props: ActionProps, tpl_engine: TplEngine,
+        translate: Callable[[str], str], resp: KResponse, result: Any) -> Union[str, bytes]:
+    try:
+        if type(result) in (str, bytes):
+            return result
+        elif type(result) is dict:
+            result['messages'] = resp.system_messages
+        elif hasattr(result, 'messages'):
+            setattr(result, 'messages', resp.system_messages)
+        return orjson.dumps(result, default=custom_json_default, option=_JSON_OPTIONS)
+    except Exception as e:
+        return orjson.dumps(dict(messages=[('error', str(e))]))
+
+
+async def _render_xml(
+        app: Sanic, action_model: AbstractPageModel, action_props: ActionProps, tpl_engine: TplEngine,
+        translate: Callable[[str], str], resp: KResponse, result: Any) -> Union[str, bytes]:
+    return Type2XML.to_xml(result)
+
+
+async def _render_plain(
+        app: Sanic, action_model: AbstractPageModel, action_props: ActionProps, tpl_engine: TplEngine,
+        translate: Callable[[str], str], resp: KResponse, result: Any) -> Union[str, bytes]:
+    if isinstance(result, (dict, DataClassJsonMixin)):
+        _raise_unsupported(result, action_props.return_type)
+    return result
+
+
+async def _render_template_xml(
+        app: Sanic, action_model: AbstractPageModel, action_props: ActionProps, tpl_engine: TplEngine,
+        translate: Callable[[str], str], resp: KResponse, result: Any) -> Union[str, bytes]:
+    return tpl_engine.render(action_props.template, result, translate)
+
+
+async def _render_template(
+        app: Sanic, action_model: AbstractPageModel, action_props: ActionProps, tpl_engine: TplEngine,
+        translate: Callable[[str], str], resp: KResponse, result: Any) -> Union[str, bytes]:
+    if not (result is None or isinstance(result, dict)):
+        _raise_unsupported(result, action_props.return_type)
+    result = await action_model.add_globals(app, action_props, result)
+    result['nonce'] = nonce = secrets.token_urlsafe()
+    if app.config['debug_level'] == 0:
+        csp_header = ['script-src', '\'self\'',
+                      f'\'nonce-{nonce}\'', *app.config['csp_domains']]
+        resp.set_header('Content-Security-Policy', ' '.join(csp_header))
+    if isinstance(result, dict):
+        result['messages'] = resp.system_messages
+    apply_theme(result, app, translate)
+    action_model.init_menu(result)
+    return tpl_engine.render(action_props.template, result, translate)
+
+
+_RENDERERS = {
+    'json': _render_json,
+    'xml': _render_xml,
+    'plain': _render_plain,
+    'template_xml': _render_template_xml,
+    'template': _render_template,
+}
+
 
 async def _output_result(
         app: Sanic,
@@ -62,44 +149,10 @@ async def _output_result(
     if 300 <= resp.http_status_code < 400 or resp.result is None:
         return ''
     result = resp.result() if callable(resp.result) else resp.result
-    if action_props.return_type == 'json':
-        try:
-            if type(result) in (str, bytes):
-                return result
-            elif type(result) is dict:
-                result['messages'] = resp.system_messages
-                return json.dumps(result)
-            else:
-                if hasattr(result, 'messages'):
-                    setattr(result, 'messages', resp.system_messages)
-                return json.dumps(result, cls=CustomJSONEncoder)
-        except Exception as e:
-            return json.dumps(dict(messages=[('error', str(e))]))
-    elif action_props.return_type == 'xml':
-        return Type2XML.to_xml(result)
-    elif action_props.return_type == 'plain' and not isinstance(result, (dict, DataClassJsonMixin)):
-        return result
-    elif action_props.return_type == 'template_xml':
-        return tpl_engine.render(action_props.template, result, translate)
-    elif action_props.return_type == 'template' and (result is None or isinstance(result, dict)):
-        result = await action_model.add_globals(app, action_props, result)
-        result['nonce'] = nonce = secrets.token_urlsafe()
-        if app.config['debug_level'] == 0:
-            csp_header = ['script-src', '\'self\'',
-                          f'\'nonce-{nonce}\'', *app.config['csp_domains']]
-            resp.set_header('Content-Security-Policy', ' '.join(csp_header))
-        if isinstance(result, dict):
-            result['messages'] = resp.system_messages
-        apply_theme(result, app, translate)
-        action_model.init_menu(result)
-        return tpl_engine.render(action_props.template, result, translate)
-
-    if (isinstance(result, dict) and
-            'messages' in result and
-            any(x[0] == 'error' for x in result['messages'])):
-        raise RuntimeError(f'Exceptions occured: {result["messages"]}')
-    raise RuntimeError(
-        f'Unsupported result and return_type combination: {result.__class__.__name__},  {action_props.return_type}')
+    renderer = _RENDERERS.get(action_props.return_type)
+    if renderer is None:
+        _raise_unsupported(result, action_props.return_type)
+    return await renderer(app, action_model, action_props, tpl_engine, translate, resp, result)
 
 
 async def resolve_error(
@@ -129,7 +182,6 @@ async def resolve_error(
 
     if is_debug:
         logging.getLogger(__name__).exception(err)
-        import traceback
         resp.add_system_message('error', traceback.format_exc())
 
     resp.set_result(ans)
@@ -144,6 +196,23 @@ def get_explicit_return_type(req: KRequest) -> Optional[str]:
     return f[0] if len(f) > 0 else None
 
 
+@lru_cache(maxsize=1024)
+def _split_action_path(path: str, app_url_prefix: str) -> Tuple[str, str]:
+    """
+    Split a request path into an action prefix and an action name. As KonText
+    routes do not contain variable parts, the number of distinct paths is limited
+    and the results can be cached.
+    """
+    if path.startswith(app_url_prefix):
+        norm_path = path[len(app_url_prefix):]
+    else:
+        norm_path = path
+    path_elms = norm_path.split('/')
+    action_name = path_elms[-1]
+    action_prefix = '/'.join(path_elms[:-1]) if len(path_elms) > 1 else ''
+    return action_prefix, action_name
+
+
 def _is_authorized_to_execute_action(amodel: AbstractPageModel, aprops: ActionProps):
     return not isinstance(amodel, AbstractUserModel) or aprops.access_level <= 1 or not amodel.user_is_anonymous()
 
@@ -194,9 +263,14 @@ def http_action(
                               intended for special modules (e.g. FCS) which require non-standard ways for this
     """
     def decorator(func: Callable[[AbstractPageModel, KRequest, KResponse], Coroutine[Any, Any, Optional[ResultType]]]):
+        # values derived solely from the decorator arguments are resolved once here
+        # (and not on each request)
+        init_result = page_model if isinstance(page_model, BaseResult) else None
+        default_return_type = 'template' if not return_type and template else return_type
+
         @wraps(func)
         async def wrapper(request: Request, *args, **kw):
-            application = Sanic.get_app('kontext')
+            application = _get_application()
             app_url_prefix = application.config['action_path_prefix']
             if mapped_args:
                 marg = create_mapped_args(mapped_args, request)
@@ -207,32 +281,23 @@ def http_action(
                 root_url=req.get_root_url(),
                 redirect_safe_domains=application.config['redirect_safe_domains'],
                 cookies_same_site=application.config['cookies_same_site'],
-                result=page_model if isinstance(page_model, BaseResult) else None
+                result=init_result
             )
 
-            if request.path.startswith(app_url_prefix):
-                norm_path = request.path[len(app_url_prefix):]
-            else:
-                norm_path = request.path
-            path_elms = norm_path.split('/')
-            action_name = path_elms[-1]
-            action_prefix = '/'.join(path_elms[:-1]) if len(path_elms) > 1 else ''
+            action_prefix, action_name = _split_action_path(request.path, app_url_prefix)
             no_anonymous_access = settings.get_bool('global', 'no_anonymous_access', False)
             if no_anonymous_access and access_level == 1:
                 runtime_access_level = 2
             else:
                 runtime_access_level = access_level
+            expl_return_type = get_explicit_return_type(req)
             aprops = ActionProps(
                 action_name=action_name, action_prefix=action_prefix,
                 access_level=runtime_access_level,
-                return_type=return_type, page_model=page_model, template=template,
+                return_type=expl_return_type if expl_return_type else default_return_type,
+                page_model=page_model, template=template,
                 mutates_result=mutates_result, action_log_mapper=action_log_mapper,
                 corpus_name_determiner=corpus_name_determiner)
-            expl_return_type = get_explicit_return_type(req)
-            if expl_return_type:
-                aprops.return_type = expl_return_type
-            elif not return_type and template:
-                aprops.return_type = 'template'
 
             shared_data = ModelsSharedData(application.ctx.tt_cache, dict())
             if action_model:
@@ -38,6 +38,11 @@ class SubcorpusError(Exception):
     pass
 
 
+def _mk_text_types_cql(tt_query: List[Tuple[str, str]]) -> str:
+    full_cql = ' within '.join(f'<{struct} {cql} />' for struct, cql in tt_query)
+    return f'aword,[] within {full_cql}'
+
+
 class SubcorpusActionModel(CorpusActionModel):
 
     TASK_TIME_LIMIT = settings.get_int('calc_backend', 'task_time_limit', 300)
@@ -64,24 +69,22 @@ class SubcorpusActionModel(CorpusActionModel):
                         aligned_corpora=specification.aligned_corpora,
                         limit_lists=False)
                     sel_attrs = {}
+                    label_attr = corpus_info.metadata.label_attr
+                    id_attr = corpus_info.metadata.id_attr
                     for k, vals in sel_match.attr_values.items():
-                        if k == corpus_info.metadata.label_attr:
-                            k = corpus_info.metadata.id_attr
+                        if k == label_attr:
+                            k = id_attr
                         # now we take only attribute entries with full data listing
                         if '.' in k and type(vals) is list:
                             sel_attrs[k] = [v[1] for v in vals]
                     tt_query = TextTypeCollector(self.corp, sel_attrs).get_query()
-                    tmp = ['<%s %s />' % item for item in tt_query]
-                    full_cql = ' within '.join(tmp)
-                    specification.text_types_cql = f'aword,[] within {full_cql}'
+                    specification.text_types_cql = _mk_text_types_cql(tt_query)
                 else:
                     raise FunctionNotSupported(
                         'Corpus must have a bibliography item defined to support this function')
             else:
                 tt_query = TextTypeCollector(self.corp, specification.text_types).get_query()
-                tmp = ['<%s %s />' % item for item in tt_query]
-                full_cql = ' within '.join(tmp)
-                specification.text_types_cql = f'aword,[] within {full_cql}'
+                specification.text_types_cql = _mk_text_types_cql(tt_query)
         elif form_type == 'within':
             specification = CreateSubcorpusWithinArgs(**specification_args)
         elif form_type == 'cql':
@@ -142,9 +145,8 @@ class SubcorpusActionModel(CorpusActionModel):
                     usesubcorp=subc_id.id
                 )))
 
-        unfinished_corpora = [at for at in (await self.get_async_tasks(
-            category=AsyncTaskStatus.CATEGORY_SUBCORPUS)) if not at.is_finished()]
-        return dict(processed_subc=[uc.to_dict() for uc in unfinished_corpora])
+        async_tasks = await self.get_async_tasks(category=AsyncTaskStatus.CATEGORY_SUBCORPUS)
+        return dict(processed_subc=[at.to_dict() for at in async_tasks if not at.is_finished()])
 
     async def create_subcorpus_draft(self):
         """
@@ -13,6 +13,7 @@
 # MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
 # GNU General Public License for more details.
 
+import asyncio
 import logging
 import os
 import time
@@ -330,11 +331,20 @@ class UserActionModel(BaseActionModel, AbstractUserModel):
             True if job was found (and updated) else False
         """
         worker = bgcalc.calc_backend_client(settings)
-        aresult = worker.AsyncResult(curr_at.ident)
+
+        def fetch_status():
+            # both the job lookup and the status read are blocking backend calls
+            ans = worker.AsyncResult(curr_at.ident)
+            return ans, (ans.status if ans else None)
+
+        aresult, status = await asyncio.get_event_loop().run_in_executor(None, fetch_status)
+        return await self._apply_async_result(curr_at, aresult, status)
+
+    async def _apply_async_result(self, curr_at: AsyncTaskStatus, aresult, status: Optional[str]) -> bool:
         if aresult:
-            curr_at.status = aresult.status
+            curr_at.status = status
             if curr_at.status == 'FAILURE':
-                result = aresult.get(timeout=2)
+                result = await aresult.get(timeout=2)
                 curr_at.error = str(result)
                 if not curr_at.error:
                     curr_at.error = result.__class__.__name__
@@ -366,13 +376,22 @@ class UserActionModel(BaseActionModel, AbstractUserModel):
             src = []
         if category is not None:
             src = [item for item in src if item.category == category]
-        ans = []
-        for item in src:
-            if not item.is_finished() and no_refresh is False:
-                found = await self.update_async_task_status(item)
-                if found:
-                    ans.append(item)
-        return ans
+        if no_refresh is not False:
+            return []
+        unfinished = [item for item in src if not item.is_finished()]
+        if not unfinished:
+            return []
+        worker = bgcalc.calc_backend_client(settings)
+
+        def fetch_statuses():
+            results = worker.AsyncResults([item.ident for item in unfinished])
+            return [(ans, (ans.status if ans else None)) for ans in results]
+
+        fetched = await asyncio.get_event_loop().run_in_executor(None, fetch_statuses)
+        found = await asyncio.gather(*(
+            self._apply_async_result(item, aresult, status)
+            for item, (aresult, status) in zip(unfinished, fetched)))
+        return [item for item, item_found in zip(unfinished, found) if item_found]
 
     def set_async_tasks(self, task_list: Iterable[AsyncTaskStatus]):
         self._req.ctx.session['async_tasks'] = [at.to_dict() for at in task_list]
@@ -17,14 +17,19 @@
 # Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
 
 
+import sys
 from dataclasses import dataclass
 from typing import Any, Callable, Optional, Tuple, Union, Dict, Awaitable
 from action.result.base import BaseResult
 from action.req_args import AnyRequestArgProxy
 from action.krequest import KRequest
 
+# ActionProps is instantiated for each request so we prefer slots where
+# available (dataclasses support them since Python 3.10)
+_DC_SLOTS = dict(slots=True) if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(**_DC_SLOTS)
 class ActionProps:
 
     action_name: str
@@ -15,6 +15,7 @@
 
 import json
 import os
+from dataclasses import fields, is_dataclass
 from typing import Any, Callable, Dict, Union
 from xml.sax.saxutils import escape
 
@@ -42,6 +43,23 @@ class CustomJSONEncoder(json.JSONEncoder):
         return super().default(o)
 
 
+def custom_json_default(o):
+    """
+    An orjson 'default' hook equivalent to CustomJSONEncoder. Plain dataclass
+    instances are encoded field by field without the deep copy performed by
+    dataclasses.asdict() (nested values are handled by orjson itself).
+    Tuple subclasses (e.g. NamedTuple) are not supported by orjson so they
+    are encoded as arrays (just like the json module does).
+    """
+    if isinstance(o, DataClassJsonMixin):
+        return o.to_dict()
+    if is_dataclass(o) and not isinstance(o, type):
+        return {f.name: getattr(o, f.name) for f in fields(o)}
+    if isinstance(o, tuple):
+        return list(o)
+    raise TypeError(f'Object of type {o.__class__.__name__} is not JSON serializable')
+
+
 def val_to_js(obj):
     s = obj.to_json() if callable(getattr(obj, 'to_json', None)) else json.dumps(obj, cls=CustomJSONEncoder)
     return markupsafe.Markup(
@@ -13,7 +13,7 @@
 # GNU General Public License for more details.
 
 import abc
-from typing import Generic, Type, TypeVar, Union
+from typing import Generic, Iterable, List, Optional, Type, TypeVar, Union
 
 T = TypeVar('T')
 
@@ -40,6 +40,13 @@ class AbstractBgClient(abc.ABC):
     @abc.abstractmethod
     async def send_task(
             self, name, ans_type: Type[T], args=None, time_limit=None, soft_time_limit=None) -> AbstractResultWrapper:
+        """
+        Send a task to a worker.
+
+        Please note that 'ans_type' serves only as a type hint for the returned
+        result wrapper - it is not passed (and serialized) to the worker. In case
+        the result type is not important, 'object.__class__' is used.
+        """
         pass
 
     @abc.abstractmethod
@@ -50,6 +57,14 @@ class AbstractBgClient(abc.ABC):
     def AsyncResult(self, ident):
         pass
 
+    def AsyncResults(self, idents: Iterable[str]) -> List[Optional[AbstractResultWrapper]]:
+        """
+        Return result wrappers for multiple tasks at once (in the order of 'idents',
+        None for tasks not found). Backends are encouraged to override the method
+        with a version fetching all the tasks in a single request.
+        """
+        return [self.AsyncResult(ident) for ident in idents]
+
     @property
     @abc.abstractmethod
     def control(self):
@@ -18,7 +18,7 @@ import logging
 import re
 import sys
 from dataclasses import dataclass
-from typing import Any, List, Type, TypeVar, Union
+from typing import Any, Iterable, List, Optional, Type, TypeVar, Union
 
 import ujson as json
 from action.errors import UserReadableException
@@ -72,8 +72,15 @@ class ResultWrapper(AbstractResultWrapper[T]):
         failed='FAILURE'
     )
 
-    def __init__(self, job):
+    def __init__(self, job, fresh: bool = False):
+        """
+        arguments:
+        job -- an Rq job
+        fresh -- if True then the job has just been loaded from Redis and its first
+                 status read need not be fetched again
+        """
         self._job = job
+        self._fresh = fresh
         self.result: Union[T, Exception] = None
 
     def _infer_error(self, exc_info, job_id):
@@ -100,17 +107,27 @@ class ResultWrapper(AbstractResultWrapper[T]):
             return err
         return Exception(f'Task failed: {job_id}')
 
+    def _fetch_result(self):
+        """
+        Return a pair (is_done, result). Please note that the method
+        performs blocking Redis calls.
+        """
+        if self._job.is_finished:
+            return True, self._job.result
+        elif self._job.is_failed:
+            self._job.refresh()
+            return True, self._infer_error(self._job.exc_info, self._job.id)
+        return False, None
+
     async def get(self, timeout=None):
         try:
             total_time = 0
             while True:
                 await asyncio.sleep(0.5)
-                if self._job.is_finished:
-                    self.result = self._job.result
-                    break
-                elif self._job.is_failed:
-                    self._job.refresh()
-                    self.result = self._infer_error(self._job.exc_info, self._job.id)
+                # job status checks are blocking Redis calls so they must not run in the event loop
+                is_done, result = await asyncio.get_event_loop().run_in_executor(None, self._fetch_result)
+                if is_done:
+                    self.result = result
                     break
                 elif timeout and total_time > timeout:
                     self.result = Exception(f'Task result timeout: {self._job}')
@@ -122,8 +139,11 @@ class ResultWrapper(AbstractResultWrapper[T]):
 
     @property
     def status(self):
-        if self._job and self._job.get_status():
-            return ResultWrapper.status_map[self._job.get_status()]
+        if self._job:
+            status = self._job.get_status(refresh=not self._fresh)
+            self._fresh = False
+            if status:
+                return ResultWrapper.status_map[status]
         return 'FAILURE'
 
     @property
@@ -227,10 +247,22 @@ class RqClient(AbstractBgClient):
 
     def AsyncResult(self, ident):
         try:
-            return ResultWrapper(Job.fetch(ident, connection=self.redis_conn))
+            return ResultWrapper(Job.fetch(ident, connection=self.redis_conn), fresh=True)
         except NoSuchJobError:
             logging.getLogger(__name__).warning(f'Job {ident} not found')
             return None
 
+    def AsyncResults(self, idents: Iterable[str]) -> List[Optional[ResultWrapper]]:
+        idents = list(idents)
+        ans = []
+        # all the jobs are loaded using a single pipelined Redis request
+        for ident, job in zip(idents, Job.fetch_many(idents, connection=self.redis_conn)):
+            if job is None:
+                logging.getLogger(__name__).warning(f'Job {ident} not found')
+                ans.append(None)
+            else:
+                ans.append(ResultWrapper(job, fresh=True))
+        return ans
+
     def is_wrapped_user_error(self, err):
         return isinstance(err, UserReadableException)
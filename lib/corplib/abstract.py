@@ -71,7 +71,7 @@ async def create_new_subc_ident(subc_root: str, corpus_name: str) -> SubcorpusId
     ensures that a target data directory exists.
     """
     ans = SubcorpusIdent(
-        id=int2chash(int(hashlib.sha1(uuid.uuid1().hex.encode()).hexdigest(), 16), 8),
+        id=int2chash(int.from_bytes(hashlib.sha1(uuid.uuid1().hex.encode()).digest(), 'big'), 8),
         corpus_name=corpus_name)
     full_dir_path = os.path.join(subc_root, ans.data_dir)
     if not await aiofiles.os.path.isdir(full_dir_path):
@@ -55,6 +55,9 @@ except ImportError:
         def compare(self, s1, s2):
             return locale.strcoll(s1, s2)
 
+        def getSortKey(self, s):
+            return locale.strxfrm(s)
+
         @staticmethod
         def createInstance(locale):
             return Collator(locale)
@@ -86,6 +89,30 @@ def sort(iterable, loc, key=None, reverse=False):
     return sorted(iterable, key=kf, reverse=reverse)
 
 
+def mk_sort_key(loc):
+    """
+    Creates a key function (usable with sorted(), list.sort() etc.) producing
+    collation keys according to the passed locale. The keys are memoized per
+    distinct string so it pays off to reuse the function when sorting multiple
+    collections with overlapping values.
+
+    arguments:
+    loc -- locale identifier (e.g. cs_CZ.UTF-8, en_US,...)
+    """
+    if not loc:
+        loc = 'en_US'
+    collator = Collator.createInstance(Locale(loc))
+    cache = {}
+
+    def key(s):
+        ans = cache.get(s)
+        if ans is None:
+            ans = collator.getSortKey(s)
+            cache[s] = ans
+        return ans
+    return key
+
+
 def time_formatting():
     """
     Returns a time formatting string (as used by time.strftime)
@@ -17,7 +17,8 @@
 # Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
 
 import abc
-from typing import Dict, List
+import json
+from typing import Dict, List, Optional
 
 from plugin_types.common import Serializable
 
@@ -66,6 +67,19 @@ class KeyValueStorage(abc.ABC):
         value -- value to be pushed
         """
 
+    async def list_append_many(self, key: str, values: List[Serializable]):
+        """
+        Add multiple values at the end of a list (in the order
+        they are provided). Implementations are encouraged to
+        perform this in a single operation.
+
+        arguments:
+        key -- data access key
+        values -- values to be pushed
+        """
+        for value in values:
+            await self.list_append(key, value)
+
     @abc.abstractmethod
     async def list_pop(self, key: str) -> Serializable:
         """
@@ -161,6 +175,19 @@ class KeyValueStorage(abc.ABC):
         default -- a value to be returned in case there is no such key
         """
 
+    async def get_raw(self, key: str) -> Optional[str]:
+        """
+        Get a value stored with passed key in its serialized
+        (JSON) form or None if there is no such key. Implementations
+        are encouraged to return the stored data as they are
+        (i.e. without decoding and encoding them again).
+
+        arguments:
+        key -- data access key
+        """
+        data = await self.get(key)
+        return None if data is None else json.dumps(data)
+
     @abc.abstractmethod
     async def set(self, key: str, data: Serializable):
         """
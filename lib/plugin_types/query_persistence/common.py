@@ -65,6 +65,6 @@ def generate_idempotent_hex_id(data: Dict[str, Any]) -> str:
 def generate_idempotent_id(data: Dict[str, Any]) -> str:
     tmp = _to_json(data)
     if tmp:
-        return _encode_to_az(int('0x' + hashlib.md5(tmp.encode('utf-8')).hexdigest(), 16))
+        return _encode_to_az(int.from_bytes(hashlib.md5(tmp.encode('utf-8')).digest(), 'big'))
     else:
         return generate_uniq_id(data)
@@ -47,6 +47,19 @@ class HTTPStatus(int):
         return self in (401, 403)
 
 
+def mk_server_url(conf: Dict[str, Any]) -> str:
+    """
+    Create a server base URL (scheme://server[:port]) out of a backend
+    configuration containing 'server', 'ssl' and optional 'port' items.
+    A port matching the scheme's default one is omitted.
+    """
+    port = conf.get('port')
+    default_port = 443 if conf['ssl'] else 80
+    port_str = f':{port}' if port and int(port) != default_port else ''
+    scheme = 'https' if conf['ssl'] else 'http'
+    return f'{scheme}://{conf["server"]}{port_str}'
+
+
 class HTTPClient:
 
     def __init__(self, server: str, enable_ssl: bool = False):
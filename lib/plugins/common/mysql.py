@@ -16,6 +16,7 @@
 # along with this program; if not, write to the Free Software
 # Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301, USA.
 
+import asyncio
 from contextlib import asynccontextmanager, contextmanager
 from dataclasses import asdict, dataclass, field
 from typing import Any, Dict, Generator, Optional
@@ -78,6 +79,8 @@ class MySQLOps:
 
     _pool: Optional[aiomysql.Pool]
 
+    _pool_lock: Optional[asyncio.Lock]
+
     _conn_args: ConnectionArgs
 
     _pool_args: PoolArgs
@@ -93,10 +96,17 @@ class MySQLOps:
         self._retry_delay = retry_delay  # TODO has no effect now
         self._retry_attempts = retry_attempts  # TODO has no effect now
         self._pool = None
+        self._pool_lock = None
 
     async def _init_pool(self):
         if self._pool is None:
-            self._pool = await aiomysql.create_pool(**asdict(self._conn_args), **asdict(self._pool_args))
+            if self._pool_lock is None:
+                # created lazily so the lock is bound to the running loop
+                self._pool_lock = asyncio.Lock()
+            async with self._pool_lock:
+                # concurrent first requests must not create (and leak) multiple pools
+                if self._pool is None:
+                    self._pool = await aiomysql.create_pool(**asdict(self._conn_args), **asdict(self._pool_args))
 
     @asynccontextmanager
     async def connection(self) -> Generator[aiomysql.Connection, None, None]:
@@ -117,8 +127,10 @@ class MySQLOps:
     @contextmanager
     def connection_sync(self) -> Generator[pymysql.Connection, None, None]:
         connection = pymysql.connect(**asdict(self._conn_args))
-        yield connection
-        connection.close()
+        try:
+            yield connection
+        finally:
+            connection.close()
 
     @contextmanager
     def cursor_sync(self, dictionary=True) -> Generator[pymysql.cursors.Cursor, None, None]:
@@ -127,5 +139,7 @@ class MySQLOps:
                 cursor = connection.cursor(pymysql.cursors.DictCursor)
             else:
                 cursor = connection.cursor()
-            yield cursor
-            cursor.close()
+            try:
+                yield cursor
+            finally:
+                cursor.close()
@@ -0,0 +1,40 @@
+# Copyright (c) 2023 Charles University in Prague, Faculty of Arts,
+#                    Institute of the Czech National Corpus
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; version 2
+# dated June, 1991.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+import unittest
+
+from plugins.common.http import mk_server_url
+
+
+class MkServerUrlTest(unittest.TestCase):
+
+    def test_default_port_omitted(self):
+        self.assertEqual(mk_server_url(dict(server='foo.cz', ssl=False, port=80)), 'http://foo.cz')
+        self.assertEqual(mk_server_url(dict(server='foo.cz', ssl=True, port=443)), 'https://foo.cz')
+        self.assertEqual(mk_server_url(dict(server='foo.cz', ssl=True, port='443')), 'https://foo.cz')
+
+    def test_custom_port_kept(self):
+        self.assertEqual(mk_server_url(dict(server='foo.cz', ssl=False, port=8080)), 'http://foo.cz:8080')
+        self.assertEqual(mk_server_url(dict(server='foo.cz', ssl=True, port='8443')), 'https://foo.cz:8443')
+
+    def test_swapped_default_port_kept(self):
+        self.assertEqual(mk_server_url(dict(server='foo.cz', ssl=True, port=80)), 'https://foo.cz:80')
+        self.assertEqual(mk_server_url(dict(server='foo.cz', ssl=False, port=443)), 'http://foo.cz:443')
+
+    def test_missing_port(self):
+        self.assertEqual(mk_server_url(dict(server='foo.cz', ssl=False)), 'http://foo.cz')
+        self.assertEqual(mk_server_url(dict(server='foo.cz', ssl=True, port=None)), 'https://foo.cz')
+
+
+if __name__ == '__main__':
+    unittest.main()
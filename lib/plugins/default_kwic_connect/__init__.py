@@ -34,7 +34,6 @@ from plugin_types.kwic_connect import AbstractKwicConnect
 from plugin_types.token_connect import AbstractBackend, AbstractFrontend
 from plugins.default_token_connect import setup_providers
 from sanic.blueprints import Blueprint
-from util import as_async
 
 bp = Blueprint('default_kwic_connect')
 
@@ -45,8 +44,11 @@ def merge_results(curr, new, word: str):
     if len(curr) == 0:
         return [[x] for x in new]
     else:
-        for i in range(len(curr)):
-            curr[i] += [new[i]]
+        if len(new) != len(curr):
+            raise ValueError(
+                f'Inconsistent number of provider results for {word}: expected {len(curr)}, got {len(new)}')
+        for curr_item, new_item in zip(curr, new):
+            curr_item.append(new_item)
         return curr
 
 
@@ -110,12 +112,11 @@ class DefaultKwicConnect(AbstractKwicConnect):
         if len(corpora) == 0:
             return False
         corpus_info = await self._corparch.get_corpus_info(plugin_ctx, corpora[0])
-        tst = [p.enabled_for_corpora([corpora[0]] + plugin_ctx.aligned_corpora)
-               for p, _ in self.map_providers(corpus_info.kwic_connect.providers)]
-        return len(tst) > 0 and True in tst
+        req_corpora = [corpora[0]] + plugin_ctx.aligned_corpora
+        return any(
+            p.enabled_for_corpora(req_corpora) for p, _ in self.map_providers(corpus_info.kwic_connect.providers))
 
-    @as_async
-    def export(self, plugin_ctx):
+    async def export(self, plugin_ctx):
         return dict(max_kwic_words=self._max_kwic_words, load_chunk_size=self._load_chunk_size)
 
     @staticmethod
@@ -154,9 +155,8 @@ class DefaultKwicConnect(AbstractKwicConnect):
 
 @plugins.inject(plugins.runtime.DB, plugins.runtime.CORPARCH)
 def create_instance(settings, db, corparch):
-    providers = setup_providers(settings.get('plugins', 'kwic_connect'),
-                                db, be_type=AbstractBackend, fe_type=AbstractFrontend)
     plg_conf = settings.get('plugins', 'kwic_connect')
+    providers = setup_providers(plg_conf, db, be_type=AbstractBackend, fe_type=AbstractFrontend)
     kwic_conn = DefaultKwicConnect(
         providers, corparch, max_kwic_words=plg_conf['max_kwic_words'],
         load_chunk_size=plg_conf['load_chunk_size'])
@@ -48,26 +48,21 @@ DEFAULT_TTL_DAYS = 100
 
 DEFAULT_ANONYMOUS_USER_TTL_DAYS = 7
 
-
-def id_exists(id):
-    """
-    Tests whether passed id exists
-    """
-    # currently we assume that id (= prefix of md5 hash with 52^12 possible values)
-    #  conflicts are very unlikely
-    return False
+_VALID_ID_RE = re.compile(r'~[0-9a-zA-Z]+')
 
 
 def mk_short_id(s, min_length):
     """
-    Generates a hash based on md5 but using [a-zA-Z0-9] characters and with
+    Generates a hash based on blake2b but using [a-zA-Z0-9] characters and with
     limited length.
 
     arguments:ucnk_op_persistence
-    s -- a string to be hashed
+    s -- a string (or bytes) to be hashed
     min_length -- minimum length of the output hash
     """
-    x = int(hashlib.md5(s).hexdigest(), 16)
+    if isinstance(s, str):
+        s = s.encode('utf-8')
+    x = int.from_bytes(hashlib.blake2b(s, digest_size=16).digest(), 'big')
     return int2chash(x, min_length)
 
 
@@ -200,7 +195,7 @@ class DefaultQueryPersistence(AbstractQueryPersistence):
         arguments:
         data_id -- identifier to be tested
         """
-        return bool(re.match(r'~[0-9a-zA-Z]+', data_id))
+        return _VALID_ID_RE.fullmatch(data_id) is not None
 
     def get_conc_ttl_days(self, user_id):
         if self._auth.is_anonymous(user_id):
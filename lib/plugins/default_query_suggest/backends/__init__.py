@@ -15,7 +15,7 @@
 import logging
 
 from plugin_types.query_suggest import AbstractBackend
-from plugins.common.http import HTTPClient
+from plugins.common.http import HTTPClient, mk_server_url
 
 
 class HTTPBackend(AbstractBackend):
@@ -26,16 +26,12 @@ class HTTPBackend(AbstractBackend):
     def __init__(self, conf, ident):
         super().__init__(ident)
         self._conf = conf
-        port_str = '' if self._conf.get('port', 80) else ':{}'.format(self._conf.get('port'))
-        if self._conf['ssl']:
-            self._client = HTTPClient('https://{}{}'.format(self._conf['server'], port_str))
-        else:
-            self._client = HTTPClient('http://{}{}'.format(self._conf['server'], port_str))
+        self._client = HTTPClient(mk_server_url(self._conf))
 
     async def find_suggestion(
             self, user_id, ui_lang, maincorp, corpora, subcorpus, value, value_type, value_subformat,
             query_type, p_attr, struct, s_attr):
         args = dict(
             ui_lang=self._client.enc_val(ui_lang), corpora=[self._client.enc_val(c) for c in corpora])
-        logging.getLogger(__name__).debug('HTTP Backend args: {0}'.format(args))
+        logging.getLogger(__name__).debug('HTTP Backend args: %s', args)
         return await self._client.request('GET', self._conf['path'], args)
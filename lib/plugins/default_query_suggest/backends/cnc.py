@@ -14,32 +14,44 @@
 
 from typing import List
 
-import ujson as json
+import orjson
 from plugin_types.query_suggest import AbstractBackend
-from plugins.common.http import HTTPClient
+from plugins.common.http import HTTPClient, mk_server_url
+from util import TTLCache
 
 
 class WordSimilarityBackend(AbstractBackend):
     """
     WordSimilarityBackend works along with CNC's word-sim-service which is
     a wrapper around Wang2Vec model.
+
+    As the results are deterministic for a (corpus, model, lemma) combination,
+    they are cached in-process (configurable via 'cacheMaxSize' and 'cacheTTL').
     """
 
+    DEFAULT_CACHE_MAX_SIZE = 10000
+
+    DEFAULT_CACHE_TTL = 3600
+
     def __init__(self, conf, ident):
         super().__init__(ident)
         self._conf = conf
-        port_str = '' if self._conf.get('port', 80) else ':{}'.format(self._conf.get('port'))
-        if self._conf['ssl']:
-            self._client = HTTPClient('https://{}{}'.format(self._conf['server'], port_str))
-        else:
-            self._client = HTTPClient('http://{}{}'.format(self._conf['server'], port_str))
+        self._client = HTTPClient(mk_server_url(self._conf))
+        self._cache = TTLCache(
+            max_size=conf.get('cacheMaxSize', self.DEFAULT_CACHE_MAX_SIZE),
+            ttl=conf.get('cacheTTL', self.DEFAULT_CACHE_TTL))
 
     async def find_suggestion(self, user_id, ui_lang, maincorp, corpora, subcorpus, value, value_type, value_subformat,
                               query_type, p_attr, struct, s_attr):
         if p_attr == 'lemma':
-            path = '/'.join([self._conf['path'], 'corpora', self._conf['corpus'], 'similarWords',
-                             self._conf['model'], self._client.enc_val(value)])
-            ans, is_found = await self._client.request('GET', path, {}, None)
-            if is_found:
-                return [v['word'] for v in json.loads(ans)]
+            ans = self._cache.get(value)
+            if ans is None:
+                path = '/'.join([self._conf['path'], 'corpora', self._conf['corpus'], 'similarWords',
+                                 self._conf['model'], self._client.enc_val(value)])
+                data, is_found = await self._client.request('GET', path, {}, None)
+                if not is_found:
+                    return []
+                ans = [v['word'] for v in orjson.loads(data)]
+                self._cache.set(value, ans)
+            return ans
         return []
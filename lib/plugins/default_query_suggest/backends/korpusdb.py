@@ -14,7 +14,7 @@
 
 import ujson as json
 from plugin_types.query_suggest import AbstractBackend
-from plugins.common.http import HTTPClient
+from plugins.common.http import HTTPClient, mk_server_url
 
 
 class KorpusDBBackend(AbstractBackend):
@@ -24,11 +24,7 @@ class KorpusDBBackend(AbstractBackend):
     def __init__(self, conf, ident):
         super().__init__(ident)
         self._conf = conf
-        port_str = '' if self._conf.get('port', 80) else ':{}'.format(self._conf.get('port'))
-        if self._conf['ssl']:
-            self._client = HTTPClient('https://{}{}'.format(self._conf['server'], port_str))
-        else:
-            self._client = HTTPClient('http://{}{}'.format(self._conf['server'], port_str))
+        self._client = HTTPClient(mk_server_url(self._conf))
 
     async def find_suggestion(
             self, ui_lang, user_id, maincorp, corpora, subcorpus, value, value_type, value_subformat,
@@ -13,11 +13,11 @@
 # MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
 # GNU General Public License for more details.
 
+import asyncio
 import logging
 from collections import defaultdict
-from typing import Callable, Tuple
+from typing import Callable, Dict, Tuple
 
-import bgcalc.freqs
 import l10n
 from conclib.freq import multi_level_crit
 from conclib.pyconc import PyConc
@@ -36,40 +36,54 @@ class PosAttrPairRelManateeBackend(AbstractBackend):
         self._translate = translate
         self._fixed_corp_name = conf.get('corpus')
         self._preset_corp = None
+        self._preset_corp_lock = None
+        self._query_attrs = [conf[f'attr{i}'] for i in range(1, 11) if f'attr{i}' in conf]
+        self._multiseps: Dict[str, Tuple[str, str]] = {}
 
     async def get_preset_corp(self):
+        """
+        Load the configured fixed corpus on first use. Concurrent requests arriving
+        before the corpus is ready wait for the first load instead of opening
+        the corpus again.
+        """
         if self._fixed_corp_name and self._preset_corp is None:
-            self._preset_corp = await CorpusFactory().get_corpus(self._fixed_corp_name)
+            if self._preset_corp_lock is None:
+                # created lazily so the lock is bound to the running loop
+                self._preset_corp_lock = asyncio.Lock()
+            async with self._preset_corp_lock:
+                if self._preset_corp is None:
+                    self._preset_corp = await CorpusFactory().get_corpus(self._fixed_corp_name)
         return self._preset_corp
 
-    def _freq_dist(self, corp: KCorpus, conc: PyConc, fcrit: str, user_id: int):
-        args = bgcalc.freqs.FreqCalcArgs(
-            corpname=corp.corpname,
-            subcname=corp.subcorpus_id,
-            subcpath=[],
-            user_id=user_id,
-            pagesize=100,
-            cutoff=0,
-            flimit=1,
-            fcrit=[fcrit],
-            rel_mode=1,
-            freq_sort='freq',
-            collator_locale='en_US',  # TODO use data provided by corparch plg
-            fmaxitems=1,
-            fpage=1)
-        freqs = [conc.xfreq_dist(
-            cr, args.flimit, args.freq_sort, args.rel_mode, args.collator_locale)
-            for cr in args.fcrit]
-        return freqs[0].Items
+    @staticmethod
+    def _freq_dist(conc: PyConc, fcrit: str):
+        return conc.xfreq_dist(
+            fcrit, limit=1, sortkey='freq', rel_mode=1,
+            collator_locale='en_US').Items  # TODO use data provided by corparch plg
 
-    def _normalize_multivalues(self, corp: KCorpus, srch_val: str, attr1: str, attr2: str) -> Tuple[str, str]:
-        multisep1 = corp.get_conf(self._conf["attr1"] + '.MULTISEP')
-        multisep2 = corp.get_conf(self._conf["attr2"] + '.MULTISEP')
+    def _get_multiseps(self, corp: KCorpus) -> Tuple[str, str]:
+        """
+        Return MULTISEP values of the two configured attributes. The values are
+        cached per corpus so the corpus configuration is not consulted for each
+        of the result items.
+        """
+        ans = self._multiseps.get(corp.corpname)
+        if ans is None:
+            ans = (
+                corp.get_conf(self._conf["attr1"] + '.MULTISEP'),
+                corp.get_conf(self._conf["attr2"] + '.MULTISEP'))
+            self._multiseps[corp.corpname] = ans
+        return ans
+
+    @staticmethod
+    def _normalize_multivalues(
+            multisep1: str, multisep2: str, srch_val: str, attr1: str, attr2: str) -> Tuple[str, str]:
         if multisep1 and multisep2:
             attr_pairs = list(zip(attr1.split(multisep1), attr2.split(multisep2)))
             if len(attr_pairs) > 1:
+                srch_val_low = srch_val.lower()
                 for attr1c, attr2c in attr_pairs:
-                    if srch_val.lower() == attr1c.lower() or srch_val.lower() == attr2c.lower():
+                    if srch_val_low == attr1c.lower() or srch_val_low == attr2c.lower():
                         return attr1c, attr2c
                 logging.warning(
                     f'PosAttrPairRelManateeBackend multivalue normalization mismatch - {attr1}...{attr2}')
@@ -77,12 +91,7 @@ class PosAttrPairRelManateeBackend(AbstractBackend):
         return attr1, attr2
 
     def mk_query(self, icase, value_norm):
-        q = []
-        for i in range(1, 11):
-            a = f'attr{i}'
-            if a in self._conf:
-                q.append('{}="{}{}"'.format(self._conf[a], icase, value_norm))
-        return ' | '.join(q)
+        return ' | '.join(f'{attr}="{icase}{value_norm}"' for attr in self._query_attrs)
 
     async def find_suggestion(
             self, user_id, ui_lang, maincorp, corpora, subcorpus, value, value_type, value_subformat,
@@ -92,7 +101,7 @@ class PosAttrPairRelManateeBackend(AbstractBackend):
         value_norm = value if value_subformat in (
             'regexp', 'advanced') else simple_query_escape(value)
         icase = '(?i)' if value_subformat in ('simple_ic',) else ''
-        rels = defaultdict(lambda: set())
+        rels = defaultdict(set)
         try:
             conc = await get_conc(
                 used_corp,
@@ -101,15 +110,16 @@ class PosAttrPairRelManateeBackend(AbstractBackend):
             conc.sync()
             mlargs = dict(ml1attr=self._conf["attr1"], ml2attr=self._conf["attr2"])
             fcrit = multi_level_crit(2, mlargs)
-            data = self._freq_dist(corp=used_corp, conc=conc, fcrit=fcrit, user_id=user_id)
+            data = self._freq_dist(conc=conc, fcrit=fcrit)
+            multisep1, multisep2 = self._get_multiseps(used_corp)
             for item in data:
                 attr1, attr2 = self._normalize_multivalues(
-                    used_corp, value_norm, *(tuple([w['n'] for w in item.Word])[:2]))
+                    multisep1, multisep2, value_norm, *(tuple([w['n'] for w in item.Word])[:2]))
                 rels[attr1].add(attr2)
         except RuntimeError as ex:
             msg = str(ex).lower()
             if 'syntax error' not in msg:
                 raise ex
+        sort_key = l10n.mk_sort_key(ui_lang)
         return dict(attrs=(self._conf['attr1'], self._conf['attr2']),
-                    data=dict((k, l10n.sort(v, ui_lang, key=lambda itm: itm, reverse=False))
-                              for k, v in rels.items()))
+                    data=dict((k, sorted(v, key=sort_key)) for k, v in rels.items()))
@@ -20,7 +20,7 @@
 import logging
 
 from plugin_types.token_connect import AbstractBackend, BackendException
-from plugins.common.http import HTTPClient
+from plugins.common.http import HTTPClient, mk_server_url
 from plugins.default_token_connect.backends.cache import cached
 
 
@@ -75,11 +75,7 @@ class HTTPBackend(AbstractBackend):
 
     def __init__(self, conf, ident, db, ttl):
         super().__init__(conf, ident, db, ttl)
-        port_str = '' if self._conf.get('port', 80) else ':{}'.format(self._conf.get('port'))
-        if self._conf['ssl']:
-            self._client = HTTPClient('https://{}{}'.format(self._conf['server'], port_str))
-        else:
-            self._client = HTTPClient('http://{}{}'.format(self._conf['server'], port_str))
+        self._client = HTTPClient(mk_server_url(self._conf))
 
     @cached
     async def fetch(self, corpora, maincorp, token_id, num_tokens, query_args, lang, is_anonymous, context=None, cookies=None):
@@ -27,7 +27,6 @@ from plugin_types.corparch import AbstractCorporaArchive
 from plugin_types.tokens_linking import AbstractTokensLinking
 from plugins.default_token_connect import setup_providers
 from sanic.blueprints import Blueprint
-from util import as_async
 
 from .backends.abstract import AbstractBackend
 
@@ -64,12 +63,11 @@ class DefaultTokensLinking(AbstractTokensLinking):
         if len(corpora) == 0:
             return False
         corpus_info = await self._corparch.get_corpus_info(plugin_ctx, corpora[0])
-        tst = [p.enabled_for_corpora([corpora[0]] + plugin_ctx.aligned_corpora)
-               for p, _ in self.map_providers(corpus_info.tokens_linking.providers)]
-        return len(tst) > 0 and True in tst
+        req_corpora = [corpora[0]] + plugin_ctx.aligned_corpora
+        return any(
+            p.enabled_for_corpora(req_corpora) for p, _ in self.map_providers(corpus_info.tokens_linking.providers))
 
-    @as_async
-    def export(self, plugin_ctx):
+    async def export(self, plugin_ctx):
         return {}
 
     @staticmethod
@@ -107,5 +105,4 @@ class DefaultTokensLinking(AbstractTokensLinking):
 def create_instance(settings, db, corparch):
     providers = setup_providers(settings.get(
         'plugins', 'tokens_linking'), db, be_type=AbstractBackend)
-    plg_conf = settings.get('plugins', 'tokens_linking')
     return DefaultTokensLinking(providers, corparch)
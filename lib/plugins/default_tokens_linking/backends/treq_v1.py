@@ -22,7 +22,7 @@ from typing import Any, List, Tuple
 
 import conclib
 import ujson as json
-from plugins.common.http import HTTPApiLogin, HTTPClient, HTTPUnauthorized
+from plugins.common.http import HTTPApiLogin, HTTPClient, HTTPUnauthorized, mk_server_url
 
 from .abstract import AbstractBackend
 
@@ -61,11 +61,7 @@ class TreqV1Backend(AbstractBackend):
         self.AVAIL_GROUPS = conf.get('availGroups', {})
         self.AVAIL_LANG_MAPPINGS = conf.get('availTranslations', {})
 
-        port_str = '' if self._conf.get('port', 80) else ':{}'.format(self._conf.get('port'))
-        if self._conf['ssl']:
-            self._client = HTTPClient('https://{}{}'.format(self._conf['server'], port_str))
-        else:
-            self._client = HTTPClient('http://{}{}'.format(self._conf['server'], port_str))
+        self._client = HTTPClient(mk_server_url(self._conf))
         self._token_api_client = HTTPApiLogin(
             conf.get('apiLoginUrl'),
             conf.get('apiToken'),
@@ -23,6 +23,10 @@ from openpyxl import Workbook
 from plugins.masm_live_attributes.doclist import DocListItem
 from templating import Type2XML
 
+# how many rows are written by the (otherwise blocking) xlsx export before it
+# yields to the event loop
+XLSX_YIELD_INTERVAL = 500
+
 
 async def export_csv(data: List[DocListItem], target_path: str) -> bool:
     if len(data) == 0:
@@ -60,8 +64,9 @@ async def export_xlsx(data: List[DocListItem], target_path: str) -> bool:
     ws = wb.active
     hd = list(data[0].attrs.keys())
     ws.append(hd)
-    for item in data:
+    for i, item in enumerate(data, 1):
         ws.append([item.attrs[k] for k in hd])
-        await asyncio.sleep(0)
+        if i % XLSX_YIELD_INTERVAL == 0:
+            await asyncio.sleep(0)
     wb.save(target_path)
     return True
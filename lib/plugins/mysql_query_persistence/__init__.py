@@ -66,8 +66,8 @@ PARTITION BY RANGE (UNIX_TIMESTAMP(created)) (
 import logging
 import re
 
+import orjson
 import plugins
-import ujson as json
 from action.errors import ForbiddenException, NotFoundException
 from plugin_types.auth import AbstractAuth
 from plugin_types.general_storage import KeyValueStorage
@@ -85,14 +85,7 @@ ID_KEY = 'id'
 QUERY_KEY = 'q'
 DEFAULT_CONC_ID_LENGTH = 12
 
-
-def id_exists(id):
-    """
-    Tests whether passed id exists
-    """
-    # currently we assume that id (= prefix of md5 hash with 52^6 possible values)
-    #  conflicts are very unlikely
-    return False
+_VALID_ID_RE = re.compile(r'~[0-9a-zA-Z]+')
 
 
 def mk_key(code):
@@ -151,7 +144,7 @@ class MySqlQueryPersistence(AbstractQueryPersistence):
         arguments:
         data_id -- identifier to be tested
         """
-        return bool(re.match(r'~[0-9a-zA-Z]+', data_id))
+        return _VALID_ID_RE.fullmatch(data_id) is not None
 
     def get_conc_ttl_days(self, user_id):
         if self._auth.is_anonymous(user_id):
@@ -195,7 +188,7 @@ class MySqlQueryPersistence(AbstractQueryPersistence):
                         'SELECT data, created, num_access FROM kontext_conc_persistence WHERE id = %s LIMIT 1', (data_id,))
                     tmp = await cursor.fetchone()
                     if tmp:
-                        data = json.loads(tmp['data'])
+                        data = orjson.loads(tmp['data'])
                         if save_access:
                             await cursor.execute(
                                 'UPDATE kontext_conc_persistence '
@@ -253,7 +246,7 @@ class MySqlQueryPersistence(AbstractQueryPersistence):
                 (conc_id,)
             )
             row = await cursor.fetchone()
-            archived_rec = json.loads(row['data']) if row is not None else None
+            archived_rec = orjson.loads(row['data']) if row is not None else None
 
             if revoke:
                 if archived_rec:
@@ -288,7 +281,7 @@ class MySqlQueryPersistence(AbstractQueryPersistence):
                         await cursor.execute(
                             'INSERT IGNORE INTO kontext_conc_persistence (id, data, created, num_access) '
                             'VALUES (%s, %s, %s, %s)',
-                            (conc_id, json.dumps(data), get_iso_datetime(), 0))
+                            (conc_id, orjson.dumps(data).decode(), get_iso_datetime(), 0))
                         ans = 1
             await cursor.connection.commit()
         return ans, archived_rec
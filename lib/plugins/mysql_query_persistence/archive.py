@@ -20,14 +20,17 @@
 A script to archive outdated concordance queries from Redis to a MySQL database.
 """
 
+import asyncio
 import datetime
 import logging
+from typing import List, Optional, Set
 
-import ujson as json
 from aiomysql import Cursor
 from plugin_types.general_storage import KeyValueStorage
 from plugins.common.mysql import MySQLOps
 
+DEFAULT_FETCH_CONCURRENCY = 8
+
 
 def get_iso_datetime():
     return datetime.datetime.now().isoformat()
@@ -41,33 +44,64 @@ async def is_archived(cursor: Cursor, conc_id):
     return (await cursor.fetchone()) is not None
 
 
+async def filter_archived(cursor: Cursor, conc_ids: List[str]) -> Set[str]:
+    """
+    From the provided concordance IDs, return the ones already archived
+    """
+    if len(conc_ids) == 0:
+        return set()
+    await cursor.execute(
+        'SELECT id FROM kontext_conc_persistence WHERE id IN ({})'.format(', '.join(['%s'] * len(conc_ids))),
+        conc_ids)
+    return set(row[0] for row in await cursor.fetchall())
+
+
 class Archiver(object):
     """
     A class which actually performs the process of archiving records
     from fast database (Redis) to a slow one (SQLite3)
     """
 
-    def __init__(self, from_db: KeyValueStorage, to_db: MySQLOps, archive_queue_key: str):
+    def __init__(
+            self, from_db: KeyValueStorage, to_db: MySQLOps, archive_queue_key: str,
+            fetch_concurrency: int = DEFAULT_FETCH_CONCURRENCY):
         """
         arguments:
         from_db -- a Redis connection
         to_db -- a SQLite3 connection
         archive_queue_key -- a Redis key used to access archive queue
+        fetch_concurrency -- max. number of concurrent requests when fetching
+                             concordance records from from_db
         """
         self._from_db: KeyValueStorage = from_db
         self._to_db: MySQLOps = to_db
         self._archive_queue_key = archive_queue_key
+        self._fetch_concurrency = max(1, fetch_concurrency)
 
     async def _get_queue_size(self):
         return await self._from_db.list_len(self._archive_queue_key)
 
+    async def _fetch_records(self, keys: List[str]) -> List[Optional[str]]:
+        """
+        Fetch serialized (JSON) records stored under the provided keys (in the same order)
+        with at most fetch_concurrency requests running at the same time.
+        """
+        sem = asyncio.Semaphore(self._fetch_concurrency)
+
+        async def fetch(key):
+            async with sem:
+                return await self._from_db.get_raw(key)
+        return await asyncio.gather(*(fetch(key) for key in keys))
+
     async def run(self, num_proc, dry_run):
         """
         Performs actual archiving process according to the parameters passed
         in constructor.
 
-        Please note that dry-run is not 100% error-prone as it also pops the items
-        from the queue and then inserts them again.
+        The processed batch is removed from the queue only once the changes are
+        committed, so a failed run leaves the queue as it was (in dry-run mode,
+        the queue is not changed at all). Reading and trimming the queue is not
+        atomic, so only one archiver may run at a time.
 
         arguments:
         num_proc -- how many items per run should be processed
@@ -86,26 +120,28 @@ class Archiver(object):
         try:
             async with self._to_db.connection() as connection:
                 async with connection.cursor() as cursor:
-                    proc_keys = {}
-                    while i < num_proc:
-                        qitem = await self._from_db.list_pop(self._archive_queue_key)
-                        if qitem is None:
-                            break
-                        key = qitem['key']
-                        already_archived = await is_archived(cursor, key)
-                        latest_proc = proc_keys.get(key)
-                        # there are possible duplicates in the queue
-                        if latest_proc and latest_proc.get('revoke') == qitem.get('revoke'):
-                            continue
-                        proc_keys[key] = qitem
+                    # the whole batch is read at once (instead of popping items one by one)
+                    qitems = await self._from_db.list_get(
+                        self._archive_queue_key, 0, num_proc - 1) if num_proc > 0 else []
+                    # there are possible duplicates in the queue - the latest entry
+                    # for each key wins
+                    proc_keys = {qitem['key']: qitem for qitem in qitems}
+                    archived = await filter_archived(
+                        cursor, [key[len(conc_prefix):] for key in proc_keys.keys()])
+                    ins_keys = []
                     for key, qitem in proc_keys.items():
                         if qitem.get('revoke', False):
                             deletes.append(key[len(conc_prefix):])
                             i += 1
-                        elif not already_archived:
-                            data = await self._from_db.get(key)
-                            inserts.append((key[len(conc_prefix):], json.dumps(data), curr_time, 0))
-                            i += 1
+                        elif key[len(conc_prefix):] not in archived:
+                            ins_keys.append(key)
+                    ins_data = await self._fetch_records(ins_keys)
+                    for key, data in zip(ins_keys, ins_data):
+                        # the records are already JSON-encoded so they can be passed
+                        # to the `data` column (of the JSON type) without re-encoding
+                        inserts.append(
+                            (key[len(conc_prefix):], data if data is not None else 'null', curr_time, 0))
+                        i += 1
                     if not dry_run:
                         if len(deletes) > 0:
                             await cursor.executemany(
@@ -119,17 +155,10 @@ class Archiver(object):
                                 inserts
                             )
                         await connection.commit()
-                    else:
-                        for ins in reversed(inserts):
-                            await self._from_db.list_append(
-                                self._archive_queue_key, dict(key=conc_prefix + ins[0]))
-                        for rm in reversed(deletes):
-                            await self._from_db.list_append(
-                                self._archive_queue_key, dict(key=conc_prefix + rm, revoke=True))
+                        # items pushed in the meantime are appended after the batch so they are kept
+                        await self._from_db.list_trim(self._archive_queue_key, len(qitems), -1)
         except Exception as ex:
             logging.getLogger(__name__).error('Failed to archive items: %s', ex,  exc_info=ex)
-            for item in inserts:
-                await self._from_db.list_append(self._archive_queue_key, dict(key=conc_prefix + item[0]))
             return dict(
                 num_processed=i,
                 error=str(ex),
@@ -142,6 +171,9 @@ class Archiver(object):
             queue_size=await self._get_queue_size())
 
 
-async def run(from_db, to_db, archive_queue_key: str, num_proc: int, dry_run: bool):
-    archiver = Archiver(from_db=from_db, to_db=to_db, archive_queue_key=archive_queue_key)
+async def run(
+        from_db, to_db, archive_queue_key: str, num_proc: int, dry_run: bool,
+        fetch_concurrency: int = DEFAULT_FETCH_CONCURRENCY):
+    archiver = Archiver(
+        from_db=from_db, to_db=to_db, archive_queue_key=archive_queue_key, fetch_concurrency=fetch_concurrency)
     return await archiver.run(num_proc, dry_run)
@@ -0,0 +1,212 @@
+# Copyright (c) 2023 Charles University, Faculty of Arts,
+#                    Institute of the Czech National Corpus
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; version 2
+# dated June, 1991.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+import asyncio
+import json
+import unittest
+from contextlib import asynccontextmanager
+
+from mocks.storage import TestingKeyValueStorage
+from plugins.mysql_query_persistence.archive import Archiver
+
+QUEUE_KEY = 'conc_arch_queue'
+
+
+class RedisListStorage(TestingKeyValueStorage):
+    """
+    TestingKeyValueStorage with Redis-like (inclusive) list ranges
+    """
+
+    def __init__(self, data=None):
+        super().__init__(data)
+        self.num_fetched = 0
+        self._num_active_fetches = 0
+        self.max_active_fetches = 0
+
+    async def list_get(self, key, from_idx=0, to_idx=-1):
+        data = self._data.get(key, [])
+        return data[from_idx:] if to_idx == -1 else data[from_idx:to_idx + 1]
+
+    async def list_trim(self, key, keep_left, keep_right):
+        data = self._data.get(key, [])
+        self._data[key] = data[keep_left:] if keep_right == -1 else data[keep_left:keep_right + 1]
+
+    async def get_raw(self, key):
+        self.num_fetched += 1
+        self._num_active_fetches += 1
+        self.max_active_fetches = max(self.max_active_fetches, self._num_active_fetches)
+        await asyncio.sleep(0)
+        self._num_active_fetches -= 1
+        return json.dumps(self._data[key]) if key in self._data else None
+
+
+class MockCursor:
+
+    def __init__(self, archived):
+        self._archived = archived
+        self._rows = []
+        self.queries = []
+        self.executed = {}
+
+    async def execute(self, sql, args):
+        self.queries.append((sql, args))
+        self._rows = [(x,) for x in args if x in self._archived]
+
+    async def fetchall(self):
+        return self._rows
+
+    async def executemany(self, sql, args):
+        self.executed[sql.split(' ')[0]] = list(args)
+
+
+class MockConnection:
+
+    def __init__(self, cursor):
+        self._cursor = cursor
+        self.num_commits = 0
+
+    @asynccontextmanager
+    async def cursor(self):
+        yield self._cursor
+
+    async def commit(self):
+        self.num_commits += 1
+
+
+class MockMySQLOps:
+
+    def __init__(self, archived=()):
+        self.cur = MockCursor(set(archived))
+        self.conn = MockConnection(self.cur)
+
+    @asynccontextmanager
+    async def connection(self):
+        yield self.conn
+
+
+def mk_queue(*keys):
+    return [dict(key=f'concordance:{k}') for k in keys]
+
+
+def mk_storage(queue):
+    return RedisListStorage({
+        QUEUE_KEY: queue,
+        'concordance:a': dict(q=['aword,[word="a"]']),
+        'concordance:b': dict(q=['aword,[word="b"]']),
+        'concordance:c': dict(q=['aword,[word="c"]']),
+    })
+
+
+class ArchiverTest(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.from_db = mk_storage(mk_queue('a', 'b', 'c'))
+        self.to_db = MockMySQLOps()
+
+    async def test_batch_is_read_at_once(self):
+        ans = await Archiver(self.from_db, self.to_db, QUEUE_KEY).run(2, False)
+        self.assertEqual(ans['num_processed'], 2)
+        self.assertIsNone(ans['error'])
+        self.assertEqual(ans['queue_size'], 1)
+        self.assertEqual(await self.from_db.list_get(QUEUE_KEY), mk_queue('c'))
+        inserts = self.to_db.cur.executed['INSERT']
+        self.assertEqual([x[0] for x in inserts], ['a', 'b'])
+        self.assertEqual(json.loads(inserts[0][1]), dict(q=['aword,[word="a"]']))
+        self.assertEqual(self.to_db.conn.num_commits, 1)
+
+    async def test_missing_record(self):
+        await self.from_db.remove('concordance:b')
+        await Archiver(self.from_db, self.to_db, QUEUE_KEY).run(10, False)
+        inserts = self.to_db.cur.executed['INSERT']
+        self.assertEqual([(x[0], x[1]) for x in inserts][1], ('b', 'null'))
+        self.assertEqual(await self.from_db.list_len(QUEUE_KEY), 0)
+
+    async def test_archived_status_checked_in_one_query(self):
+        self.to_db = MockMySQLOps(archived=['b'])
+        ans = await Archiver(self.from_db, self.to_db, QUEUE_KEY).run(10, False)
+        self.assertEqual(self.to_db.cur.queries, [
+            ('SELECT id FROM kontext_conc_persistence WHERE id IN (%s, %s, %s)', ['a', 'b', 'c'])])
+        self.assertEqual([x[0] for x in self.to_db.cur.executed['INSERT']], ['a', 'c'])
+        self.assertEqual(self.from_db.num_fetched, 2)
+        self.assertEqual(ans['num_processed'], 2)
+
+    async def test_fetch_concurrency_is_bounded(self):
+        keys = [f'k{i}' for i in range(20)]
+        data = {f'concordance:{k}': dict(q=[k]) for k in keys}
+        data[QUEUE_KEY] = mk_queue(*keys)
+        self.from_db = RedisListStorage(data)
+        ans = await Archiver(self.from_db, self.to_db, QUEUE_KEY, fetch_concurrency=3).run(20, False)
+        self.assertEqual(ans['num_processed'], 20)
+        self.assertEqual(self.from_db.max_active_fetches, 3)
+        self.assertEqual([x[0] for x in self.to_db.cur.executed['INSERT']], keys)
+
+    async def test_duplicates_in_batch(self):
+        queue = mk_queue('a', 'b', 'a') + [dict(key='concordance:b', revoke=True)]
+        self.from_db = mk_storage(queue)
+        ans = await Archiver(self.from_db, self.to_db, QUEUE_KEY).run(10, False)
+        self.assertEqual(ans['num_processed'], 2)
+        self.assertEqual(self.to_db.cur.queries[0][1], ['a', 'b'])
+        # the latest entry for each key wins
+        self.assertEqual([x[0] for x in self.to_db.cur.executed['INSERT']], ['a'])
+        self.assertEqual(self.to_db.cur.executed['DELETE'], ['b'])
+        self.assertEqual(self.from_db.num_fetched, 1)
+
+    async def test_dry_run_keeps_queue(self):
+        queue = mk_queue('a', 'b') + [dict(key='concordance:c', revoke=True)]
+        self.from_db = mk_storage(queue)
+        ans = await Archiver(self.from_db, self.to_db, QUEUE_KEY).run(10, True)
+        self.assertEqual(ans['num_processed'], 3)
+        self.assertTrue(ans['dry_run'])
+        self.assertEqual(self.to_db.cur.executed, {})
+        self.assertEqual(self.to_db.conn.num_commits, 0)
+        self.assertEqual(await self.from_db.list_get(QUEUE_KEY), queue)
+
+    async def _assert_failed_run_keeps_queue(self, queue, error):
+        with self.assertLogs('plugins.mysql_query_persistence.archive', level='ERROR'):
+            ans = await Archiver(self.from_db, self.to_db, QUEUE_KEY).run(2, False)
+        self.assertEqual(ans['error'], error)
+        self.assertEqual(ans['queue_size'], len(queue))
+        self.assertEqual(await self.from_db.list_get(QUEUE_KEY), queue)
+
+    async def test_failed_commit_keeps_queue(self):
+        async def failing_commit():
+            raise Exception('commit failed')
+        self.to_db.conn.commit = failing_commit
+        await self._assert_failed_run_keeps_queue(mk_queue('a', 'b', 'c'), 'commit failed')
+
+    async def test_failed_fetch_keeps_queue(self):
+        queue = [dict(key='concordance:c', revoke=True)] + mk_queue('a', 'b')
+        self.from_db = mk_storage(queue)
+
+        async def failing_get_raw(key):
+            raise Exception('fetch failed')
+        self.from_db.get_raw = failing_get_raw
+        await self._assert_failed_run_keeps_queue(queue, 'fetch failed')
+
+    async def test_failed_archived_check_keeps_queue(self):
+        async def failing_execute(sql, args):
+            raise Exception('query failed')
+        self.to_db.cur.execute = failing_execute
+        await self._assert_failed_run_keeps_queue(mk_queue('a', 'b', 'c'), 'query failed')
+
+    async def test_items_pushed_during_run_are_kept(self):
+        async def get_raw(key):
+            await self.from_db.list_append(QUEUE_KEY, dict(key='concordance:d'))
+            return '{}'
+        self.from_db.get_raw = get_raw
+        await Archiver(self.from_db, self.to_db, QUEUE_KEY).run(2, False)
+        self.assertEqual(await self.from_db.list_get(QUEUE_KEY), mk_queue('c', 'd', 'd'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -74,6 +74,17 @@ class RedisDb(KeyValueStorage):
         """
         await self._redis.rpush(key, json.dumps(value))
 
+    async def list_append_many(self, key, values):
+        """
+        Add multiple values at the end of a list using a single RPUSH
+
+        arguments:
+        key -- data access key
+        values -- values to be pushed
+        """
+        if len(values) > 0:
+            await self._redis.rpush(key, *(json.dumps(v) for v in values))
+
     async def list_pop(self, key):
         """
         Removes and returns the first element of the list stored at key.
@@ -175,6 +186,10 @@ class RedisDb(KeyValueStorage):
             return json.loads(data)
         return default
 
+    async def get_raw(self, key):
+        data = await self._redis.get(key)
+        return data.decode('utf-8') if data else None
+
     async def set(self, key, data):
         """
         Saves 'data' with 'key'.
@@ -84,6 +84,20 @@ class RejsonDb(RedisDb):
             await self.set(key, '[]')
         await self._redis.execute_command('JSON.ARRAPPEND', key, '.', json.dumps(value))
 
+    async def list_append_many(self, key, values):
+        """
+        Add multiple values at the end of a list
+
+        arguments:
+        key -- data access key
+        values -- values to be pushed
+        """
+        if len(values) == 0:
+            return
+        if not await self.exists(key):
+            await self.set(key, '[]')
+        await self._redis.execute_command('JSON.ARRAPPEND', key, '.', *(json.dumps(v) for v in values))
+
     async def list_pop(self, key):
         """
         Removes and returns the first element of the list stored at key.
@@ -189,6 +203,10 @@ class RejsonDb(RedisDb):
             return default
         return json.loads(data)
 
+    async def get_raw(self, key):
+        data = await self._redis.execute_command('JSON.GET', key, '.')
+        return data.decode('utf-8') if data is not None else None
+
     async def set(self, key, data):
         """
         Saves 'data' with 'key'.
@@ -37,6 +37,7 @@ import logging
 import os
 import time
 from contextlib import asynccontextmanager
+from typing import Optional
 
 import aiosqlite
 import ujson as json
@@ -57,19 +58,48 @@ class DefaultDb(KeyValueStorage):
         conf -- a dictionary containing 'settings' module compatible configuration of the plug-in
         """
         self._db_path = db_path
+        self._conn: Optional[aiosqlite.Connection] = None
+
+    async def _open_connection(self) -> aiosqlite.Connection:
+        conn = await aiosqlite.connect(self._db_path)
+        # WAL allows readers to work along with a writer, NORMAL sync. is safe with WAL
+        await conn.execute('PRAGMA journal_mode=WAL')
+        await conn.execute('PRAGMA synchronous=NORMAL')
+        await conn.execute('PRAGMA temp_store=MEMORY')
+        return conn
 
     @asynccontextmanager
     async def connection(self):
-        async with aiosqlite.connect(self._db_path) as conn:
-            yield conn
+        """
+        Provide a long-lived connection (opened on first use) to avoid
+        the overhead of opening the database (and starting aiosqlite's worker
+        thread) for each operation.
+        """
+        if self._conn is None:
+            conn = await self._open_connection()
+            if self._conn is None:
+                self._conn = conn
+            else:  # a concurrent call has been faster
+                await conn.close()
+        yield self._conn
+
+    async def close(self):
+        """
+        Commit any pending changes and close the connection (if open).
+        """
+        if self._conn is not None:
+            conn, self._conn = self._conn, None
+            await conn.commit()
+            await conn.close()
+
+    async def on_server_stop(self):
+        await self.close()
 
     async def _delete_expired(self, key):
         async with self.connection() as conn:
-            cursor = await conn.execute('SELECT expires FROM data WHERE key = ?', (key,))
-            ans = await cursor.fetchone()
-            if ans and -1 < ans[0] < time.time():
-                await cursor.execute('DELETE FROM data WHERE key = ?', (key,))
-                await conn.commit()
+            await conn.execute(
+                'DELETE FROM data WHERE key = ? AND expires > -1 AND expires < ?', (key, time.time()))
+            await conn.commit()
             return None
 
     async def _load_raw_data(self, key):
@@ -113,6 +143,11 @@ class DefaultDb(KeyValueStorage):
         data.append(value)
         await self.set(key, data)
 
+    async def list_append_many(self, key, values):
+        data = await self.list_get(key)
+        data.extend(values)
+        await self.set(key, data)
+
     async def list_pop(self, key):
         data = await self.list_get(key)
         ans = data.pop(0)
@@ -195,6 +230,10 @@ class DefaultDb(KeyValueStorage):
             return data
         return default
 
+    async def get_raw(self, key):
+        raw_data = await self._load_raw_data(key)
+        return raw_data[0] if raw_data is not None else None
+
     async def set(self, key, data):
         """
         Saves 'data' with 'key'.
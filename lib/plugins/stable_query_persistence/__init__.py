@@ -33,6 +33,8 @@ import os
 import re
 import sqlite3
 import time
+from collections import defaultdict
+from typing import Dict, List, Optional, Tuple
 
 import plugins
 import ujson as json
@@ -47,6 +49,17 @@ ID_KEY = 'id'
 USER_ID_KEY = 'user_id'
 DEFAULT_TTL_DAYS = 7
 
+# SQLite's default limit (SQLITE_MAX_ATTACHED) of databases attached to a connection
+MAX_ATTACHED_ARCHIVES = 10
+
+# archive access statistics are written once this number of accesses is collected...
+ACCESS_FLUSH_THRESHOLD = 100
+
+# ... or once the oldest of the collected accesses is older than this
+ACCESS_FLUSH_INTERVAL_SECS = 30
+
+_VALID_ID_RE = re.compile(r'~[0-9a-zA-Z]+')
+
 
 def mk_key(code):
     return 'concordance:%s' % (code, )
@@ -59,7 +72,16 @@ class StableQueryPersistence(AbstractQueryPersistence):
         plugin_conf = settings.get('plugins', 'query_persistence')
         self._ttl_days = int(plugin_conf.get('ttl_days', DEFAULT_TTL_DAYS))
         self._archive_db_path = plugin_conf.get('archive_db_path')
-        self._archives = self._open_archives() if self._archive_db_path else []
+        # (connection, schema name) pairs, latest archive first
+        self._archives: List[Tuple[sqlite3.Connection, str]] = []
+        # (connection, query searching all the archives available via the connection)
+        self._archive_queries: List[Tuple[sqlite3.Connection, str]] = []
+        if self._archive_db_path:
+            self._open_archives()
+        # buffered (access time, ID) pairs of loaded archive records
+        self._access_buf: Dict[Tuple[sqlite3.Connection, str], List[Tuple[int, str]]] = defaultdict(list)
+        self._access_buf_size = 0
+        self._access_buf_since = 0
         self._settings = settings
 
     @property
@@ -69,7 +91,7 @@ class StableQueryPersistence(AbstractQueryPersistence):
     def is_valid_id(self, data_id):
         # we intentionally accept non-hex chars here so we can accept also conc keys
         # generated from default_conc_persistence and derived plug-ins.
-        return bool(re.match(r'~[0-9a-zA-Z]+', data_id))
+        return _VALID_ID_RE.fullmatch(data_id) is not None
 
     def get_conc_ttl_days(self, user_id):
         return self._ttl_days
@@ -105,26 +127,62 @@ class StableQueryPersistence(AbstractQueryPersistence):
         """
         data = await self.db.get(mk_key(data_id))
         if data is None and self._archive_db_path is not None:
-            for arch_db in self._archives:
-                cursor = arch_db.cursor()
-                tmp = cursor.execute(
-                    'SELECT data, num_access FROM archive WHERE id = ?', (data_id,)).fetchone()
-                if tmp:
-                    data = json.loads(tmp[0])
-                    if save_access:
-                        cursor.execute('UPDATE archive SET last_access = ?, num_access = num_access + 1 WHERE id = ?',
-                                       (int(round(time.time())), data_id))
-                        arch_db.commit()
-                    break
+            found = self._find_archived(data_id)
+            if found:
+                arch_db, schema, raw_data = found
+                data = json.loads(raw_data)
+                if save_access:
+                    self._register_access(arch_db, schema, data_id)
         return data
 
-    def find_key_db(self, data_id):
-        for arch_db in self._archives:
-            cursor = arch_db.cursor()
-            tmp = cursor.execute(
-                'SELECT COUNT(*) FROM archive WHERE id = ?', (data_id,)).fetchone()
-            if tmp[0] > 0:
-                return arch_db
+    def _register_access(self, arch_db: sqlite3.Connection, schema: str, data_id: str):
+        """
+        Buffer an access to an archived record. The buffer is written
+        once it is large or old enough (see ACCESS_FLUSH_* constants) so
+        reading an archived record does not mean a write transaction
+        each time.
+        """
+        now = int(round(time.time()))
+        if self._access_buf_size == 0:
+            self._access_buf_since = now
+        self._access_buf[(arch_db, schema)].append((now, data_id))
+        self._access_buf_size += 1
+        if (self._access_buf_size >= ACCESS_FLUSH_THRESHOLD or
+                now - self._access_buf_since >= ACCESS_FLUSH_INTERVAL_SECS):
+            self._flush_access_stats()
+
+    def _flush_access_stats(self):
+        """
+        Write buffered access statistics using a single transaction
+        per archive connection.
+        """
+        conns = set()
+        for (arch_db, schema), items in self._access_buf.items():
+            arch_db.executemany(
+                f'UPDATE {schema}.archive SET last_access = ?, num_access = num_access + 1 WHERE id = ?', items)
+            conns.add(arch_db)
+        for arch_db in conns:
+            arch_db.commit()
+        self._access_buf.clear()
+        self._access_buf_size = 0
+
+    async def on_soft_reset(self):
+        self._flush_access_stats()
+
+    async def on_server_stop(self):
+        # make sure no buffered access statistics are lost
+        self._flush_access_stats()
+
+    def _find_archived(self, data_id: str) -> Optional[Tuple[sqlite3.Connection, str, str]]:
+        """
+        Search for a record in all the archives (a single query per
+        connection) and return a triple (connection, schema, raw data)
+        for the latest archive containing the record.
+        """
+        for arch_db, sql in self._archive_queries:
+            tmp = arch_db.execute(sql, dict(id=data_id)).fetchone()
+            if tmp:
+                return arch_db, tmp[0], tmp[1]
         return None
 
     async def store(self, user_id, curr_data, prev_data=None):
@@ -149,24 +207,21 @@ class StableQueryPersistence(AbstractQueryPersistence):
 
     @property
     def _latest_archive(self):
-        return self._archives[0]
+        return self._archives[0][0]
 
     async def archive(self, user_id, conc_id, revoke=False):
-        archive_db = self.find_key_db(conc_id)
-        if archive_db:
-            cursor = archive_db.cursor()
-            cursor.execute(
-                'SELECT id, data, created integer, num_access, last_access FROM archive WHERE id = ? LIMIT 1',
-                (conc_id,))
-            row = cursor.fetchone()
-            archived_rec = json.loads(row[1]) if row else None
+        found = self._find_archived(conc_id)
+        if found:
+            archive_db, schema, raw_data = found
+            archived_rec = json.loads(raw_data)
         else:
-            cursor = None
+            archive_db, schema = None, None
             archived_rec = None
 
         if revoke:
             if archived_rec:
-                cursor.execute('DELETE FROM archive WHERE id = ?', (conc_id,))
+                archive_db.execute(f'DELETE FROM {schema}.archive WHERE id = ?', (conc_id,))
+                archive_db.commit()
                 ans = 1
             else:
                 raise NotFoundException('Concordance {0} not archived'.format(conc_id))
@@ -192,7 +247,7 @@ class StableQueryPersistence(AbstractQueryPersistence):
         return ans, archived_rec
 
     async def is_archived(self, conc_id):
-        return self.find_key_db(conc_id) is not None
+        return self._find_archived(conc_id) is not None
 
     async def will_be_archived(self, plugin_ctx, conc_id: str):
         return not (await self.is_archived(conc_id)) \
@@ -209,17 +264,31 @@ class StableQueryPersistence(AbstractQueryPersistence):
         return archive_concordance,
 
     def _open_archives(self):
+        """
+        Open all the archives found in the directory of the current archive.
+        Instead of a connection per archive file, older archives are attached
+        (up to MAX_ATTACHED_ARCHIVES per connection) so a record can be searched
+        for in all of them via a single UNION ALL query.
+        """
         root_dir = os.path.dirname(self._archive_db_path)
         curr_file = os.path.basename(self._archive_db_path)
-        curr_db = sqlite3.connect(self._archive_db_path)
-        dbs = []
-        for item in os.listdir(root_dir):
-            if item != curr_file:
-                dbs.append((item, sqlite3.connect(os.path.join(root_dir, item))))
-        dbs = [(curr_file, curr_db)] + sorted(dbs, reverse=True)
-        logging.getLogger(__name__).info(
-            'using conc_persistence archives {0}'.format([x[0] for x in dbs]))
-        return [x[1] for x in dbs]
+        files = [curr_file] + sorted(
+            (item for item in os.listdir(root_dir) if item != curr_file), reverse=True)
+        logging.getLogger(__name__).info('using conc_persistence archives {0}'.format(files))
+        group_size = MAX_ATTACHED_ARCHIVES + 1
+        for i in range(0, len(files), group_size):
+            group = files[i:i + group_size]
+            conn = sqlite3.connect(os.path.join(root_dir, group[0]))
+            schemas = ['main']
+            for j, item in enumerate(group[1:], 1):
+                schema = f'a{j}'
+                conn.execute(f'ATTACH DATABASE ? AS {schema}', (os.path.join(root_dir, item),))
+                schemas.append(schema)
+            self._archives.extend((conn, schema) for schema in schemas)
+            sql = ' UNION ALL '.join(
+                f"SELECT '{schema}' AS src, data, {k} AS ord FROM {schema}.archive WHERE id = :id"
+                for k, schema in enumerate(schemas))
+            self._archive_queries.append((conn, f'{sql} ORDER BY ord LIMIT 1'))
 
 
 @inject(plugins.runtime.DB)
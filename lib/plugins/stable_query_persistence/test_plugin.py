@@ -0,0 +1,98 @@
+# Copyright (c) 2023 Charles University, Faculty of Arts,
+#                    Institute of the Czech National Corpus
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; version 2
+# dated June, 1991.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+import json
+import os
+import sqlite3
+import tempfile
+import unittest
+
+from mocks.storage import TestingKeyValueStorage
+from plugins.stable_query_persistence import StableQueryPersistence
+
+CREATE_ARCHIVE_SQL = (
+    'CREATE TABLE archive (id text, data text NOT NULL, created integer NOT NULL, num_access integer '
+    'NOT NULL DEFAULT 0, last_access integer, PRIMARY KEY (id))')
+
+
+class MockSettings:
+
+    def __init__(self, archive_db_path):
+        self._archive_db_path = archive_db_path
+
+    def get(self, section, key):
+        return dict(archive_db_path=self._archive_db_path)
+
+
+class TestPlugin(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self._tmp_dir = tempfile.TemporaryDirectory()
+        # the current archive and an older one
+        self._curr_path = os.path.join(self._tmp_dir.name, 'archive.db')
+        self._old_path = os.path.join(self._tmp_dir.name, 'archive.2022.db')
+        self._create_archive(self._curr_path, 'curr1')
+        self._create_archive(self._old_path, 'old1')
+        self._plugin = StableQueryPersistence(TestingKeyValueStorage({}), MockSettings(self._curr_path))
+
+    def tearDown(self):
+        for conn in {conn for conn, _ in self._plugin._archives}:
+            conn.close()
+        self._tmp_dir.cleanup()
+
+    @staticmethod
+    def _create_archive(path, data_id):
+        conn = sqlite3.connect(path)
+        conn.execute(CREATE_ARCHIVE_SQL)
+        conn.execute(
+            'INSERT INTO archive (id, data, created) VALUES (?, ?, ?)',
+            (data_id, json.dumps(dict(id=data_id, q=['aword,[]'], corpora=['syn2020'])), 0))
+        conn.commit()
+        conn.close()
+
+    @staticmethod
+    def _get_access(path, data_id):
+        conn = sqlite3.connect(path)
+        try:
+            return conn.execute(
+                'SELECT num_access, last_access FROM archive WHERE id = ?', (data_id,)).fetchone()
+        finally:
+            conn.close()
+
+    async def test_open_searches_all_archives(self):
+        self.assertEqual((await self._plugin.open('curr1'))['id'], 'curr1')
+        self.assertEqual((await self._plugin.open('old1'))['id'], 'old1')
+        self.assertIsNone(await self._plugin.open('foo'))
+
+    async def test_access_is_buffered(self):
+        await self._plugin.open('old1')
+        self.assertEqual(self._get_access(self._old_path, 'old1'), (0, None))
+
+    async def test_server_stop_flushes_access(self):
+        await self._plugin.open('curr1')
+        await self._plugin.open('old1')
+        await self._plugin.open('old1')
+        await self._plugin.on_server_stop()
+        num_access, last_access = self._get_access(self._curr_path, 'curr1')
+        self.assertEqual(num_access, 1)
+        self.assertIsNotNone(last_access)
+        self.assertEqual(self._get_access(self._old_path, 'old1')[0], 2)
+
+    async def test_soft_reset_flushes_access(self):
+        await self._plugin.open('old1')
+        await self._plugin.on_soft_reset()
+        self.assertEqual(self._get_access(self._old_path, 'old1')[0], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
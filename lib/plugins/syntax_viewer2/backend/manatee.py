@@ -29,6 +29,8 @@ class ManateeBackend2(mbk.ManateeBackend):
     def import_parent_values(self, v):
         if type(v) is int:
             return [v]
+        if '|' not in v:  # the most common case - a single parent
+            return [int(v)] if v != '' else []
         return [int(x) for x in v.split('|') if x != '']
 
     def _fetch_fallback_info(self, corpus, corpus_id, token_id, kwic_len, parent_attr, ref_attrs):
@@ -32,13 +32,18 @@ from views.wordlist import create_result as wl_create_result, view_result as wl_
 
 bp = Blueprint('ucnk_backlinks', url_prefix='b')
 
+# col_lemma query operations; to be filled in via (cl, cl, pf) and (cl, cl, pw)
+_COL_LEMMA_QUERY_TPL = 'q(meet [col_lemma="%s"][col_lemma="%s" & lemma="%s"] 0 15)'
+_COL_LEMMA_FILTER_TPL = 'p0 15 -1 (meet[col_lemma="%s"][col_lemma="%s" & lc="%s"] -15 0)'
+
 
 def col_lemma_log(request: KRequest):
+    args = request.args
     return dict(
-        corpname=request.args.get('corpname'), maincorp=request.args.get('maincorp'),
-        viewmode=request.args.get('viewmode'), pagesize=request.args.get('pagesize'),
-        attrs=request.args.get('attrs'), attr_vmode=request.args.get('attrs_vmode'),
-        q=request.args.get('q'))
+        corpname=args.get('corpname'), maincorp=args.get('maincorp'),
+        viewmode=args.get('viewmode'), pagesize=args.get('pagesize'),
+        attrs=args.get('attrs'), attr_vmode=args.get('attrs_vmode'),
+        q=args.get('q'))
 
 
 @bp.route('/col_lemma')
@@ -53,16 +58,13 @@ async def col_lemma(amodel: ConcActionModel, req: KRequest, resp: KResponse):
         raise UserReadableException('Missing parameter "cl"')
     if amodel.args.corpname not in ('syn_v11', ):
         raise UserReadableException('Function not supported in {}'.format(amodel.args.corpname))
-    pf = req.args.get('p')
-    if not pf:
-        pf = '.*'
-    pw = req.args.get('pw')
-    if not pw:
-        pw = '.*'
-    cl_attr = 'col_lemma'
-    amodel.args.q = [f'q(meet [{cl_attr}="{cl}"][{cl_attr}="{cl}" & lemma="{pf}"] 0 15)']
-    amodel.args.q.extend(['Fs', 'f'])
-    amodel.args.q.append(f'p0 15 -1 (meet[{cl_attr}="{cl}"][{cl_attr}="{cl}" & lc="{pw}"] -15 0)')
+    pf = req.args.get('p') or '.*'
+    pw = req.args.get('pw') or '.*'
+    amodel.args.q = [
+        _COL_LEMMA_QUERY_TPL % (cl, cl, pf),
+        'Fs',
+        'f',
+        _COL_LEMMA_FILTER_TPL % (cl, cl, pw)]
     amodel.args.refs = '=doc.title,=doc.pubyear'
     amodel.args.pagesize = 50
     amodel.args.attrs = 'word'
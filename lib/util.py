@@ -1,6 +1,9 @@
 import asyncio
+import string
+import time
+from collections import OrderedDict
 from functools import partial, wraps
-from typing import AsyncIterator, TypeVar
+from typing import Any, AsyncIterator, Callable, Hashable, Optional, TypeVar
 
 T = TypeVar('T')
 
@@ -29,20 +32,62 @@ async def anext(ait: AsyncIterator):
     return await ait.__anext__()
 
 
-_KEY_ALPHABET = (
-        [chr(x) for x in range(ord('a'), ord('z') + 1)] +
-        [chr(x) for x in range(ord('A'), ord('Z') + 1)] +
-        ['%d' % i for i in range(10)])
+class TTLCache:
+    """
+    A simple in-process LRU cache with expiring items.
+    As the cache is used within a single event loop, no locking is needed.
+    """
+
+    def __init__(self, max_size: int, ttl: float):
+        self._max_size = max_size
+        self._ttl = ttl
+        self._data = OrderedDict()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        item = self._data.get(key)
+        if item is None:
+            return None
+        expires, value = item
+        if expires < time.monotonic():
+            del self._data[key]
+            return None
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any):
+        self._data[key] = (time.monotonic() + self._ttl, value)
+        self._data.move_to_end(key)
+        if len(self._data) > self._max_size:
+            self._data.popitem(last=False)
+
+    def remove_if(self, cond: Callable[[Hashable], bool]):
+        """
+        Remove all the items with keys matching the provided condition.
+        """
+        for key in [k for k in self._data.keys() if cond(k)]:
+            del self._data[key]
+
+
+_KEY_ALPHABET = (string.ascii_lowercase + string.ascii_uppercase + string.digits).encode('ascii')
+
+_KEY_BASE = len(_KEY_ALPHABET)
+
+# maps digits (0 ... _KEY_BASE - 1) to the respective alphabet characters
+_KEY_DIGITS_TRANS = bytes.maketrans(bytes(range(_KEY_BASE)), _KEY_ALPHABET)
 
 
 def int2chash(hex_num: int, length: int) -> str:
     """
     Generates a slightly compressed alphanum hash (using all the alphabet) out
     of provided integer.
+
+    Please note that the function is used to generate idempotent (stored)
+    query IDs so its output must not change. This is why the (inexact) float
+    division is kept here - e.g. an exact divmod() produces different digits
+    for large numbers.
     """
-    ans = []
-    while hex_num > 0 and len(ans) < length:
-        p = hex_num % len(_KEY_ALPHABET)
-        ans.append(_KEY_ALPHABET[p])
-        hex_num = int(hex_num / len(_KEY_ALPHABET))
-    return ''.join([str(x) for x in ans])
+    digits = bytearray()
+    while hex_num > 0 and len(digits) < length:
+        digits.append(hex_num % _KEY_BASE)
+        hex_num = int(hex_num / _KEY_BASE)
+    return digits.translate(_KEY_DIGITS_TRANS).decode('ascii')
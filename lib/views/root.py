@@ -13,6 +13,7 @@
 # MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
 # GNU General Public License for more details.
 
+import asyncio
 import os
 from typing import Any, Dict, Optional
 
@@ -31,6 +32,9 @@ from sanic import Blueprint
 
 bp = Blueprint('root')
 
+# how long get_task_result waits for an unfinished task before responding with 202 Accepted
+TASK_RESULT_MAX_WAIT_SECS = 2
+
 
 @bp.route('/')
 @http_action()
@@ -58,23 +62,34 @@ async def check_tasks_status(amodel: UserActionModel, req: KRequest, resp: KResp
         resp.add_system_message('error', 'task not found')
         resp.set_not_found()
         return dict(data=None)
-    return dict(data=task.to_dict())
+    return dict(data=task)
 
 
 @bp.route('/get_task_result')
 @http_action(return_type='json')
 async def get_task_result(amodel: BaseActionModel, req: KRequest, resp: KResponse):
     worker = bgcalc.calc_backend_client(settings)
-    result = worker.AsyncResult(req.args.get('task_id'))
-    return dict(result=await result.get())
+    # fetching the job is a blocking call to the worker server
+    result = await asyncio.get_event_loop().run_in_executor(None, worker.AsyncResult, req.args.get('task_id'))
+    if result is None:
+        resp.set_not_found()
+        return dict(result=None)
+    try:
+        return dict(result=await asyncio.wait_for(result.get(), timeout=TASK_RESULT_MAX_WAIT_SECS))
+    except asyncio.TimeoutError:
+        # clients are expected to poll for the task status (see check_tasks_status)
+        resp.set_http_status(202)
+        return dict(result=None, pending=True)
 
 
 @bp.route('/remove_task_info', methods=['DELETE'])
 @http_action(return_type='json', action_model=UserActionModel)
 async def remove_task_info(amodel: UserActionModel, req: KRequest, resp: KResponse) -> Dict[str, Any]:
     task_ids = req.form_getlist('tasks')
-    amodel.set_async_tasks([x for x in (await amodel.get_async_tasks()) if x.ident not in task_ids])
-    return dict(data=[t.to_dict() for t in (await amodel.get_async_tasks())])
+    # the tasks have just been refreshed so there is no need to ask the worker server again
+    remaining = [x for x in (await amodel.get_async_tasks()) if x.ident not in task_ids]
+    amodel.set_async_tasks(remaining)
+    return dict(data=[x for x in remaining if not x.is_finished()])
 
 
 @bp.route('/compatibility')
@@ -18,6 +18,8 @@ import logging
 import math
 import os
 from dataclasses import asdict, dataclass
+from functools import lru_cache
+from operator import attrgetter
 from typing import Any, Dict, List
 
 import l10n
@@ -40,9 +42,18 @@ from main_menu.model import MainMenu
 from plugin_types.subc_storage import (
     AbstractSubcArchive, SubcListFilterArgs, SubcListFilterClientArgs)
 from sanic import Blueprint
+from util import as_async
 
 bp = Blueprint('subcorpus', url_prefix='subcorpus')
 
+# subcorpus attributes which are sorted by their natural order (i.e. not by a locale-aware collation)
+_NATIVE_SORT_KEYS = frozenset(('size', 'created'))
+
+
+@lru_cache(maxsize=16)
+def _attr_getter(sort_key: str) -> attrgetter:
+    return attrgetter(sort_key)
+
 
 @bp.route('/properties')
 @http_action(
@@ -182,11 +193,10 @@ async def _filter_subcorpora(amodel: UserActionModel, req: KRequest, ignore_no_s
     sort_key, rev = amodel.parse_sorting_param(sort)
     total_pages = 1
     if full_list:
-        if sort_key in ('size', 'created'):
-            full_list = sorted(full_list, key=lambda x: getattr(x, sort_key), reverse=rev)
+        if sort_key in _NATIVE_SORT_KEYS:
+            full_list.sort(key=_attr_getter(sort_key), reverse=rev)
         else:
-            full_list = l10n.sort(full_list, loc=req.ui_lang,
-                                  key=lambda x: getattr(x, sort_key), reverse=rev)
+            full_list = l10n.sort(full_list, loc=req.ui_lang, key=_attr_getter(sort_key), reverse=rev)
 
         total_pages = math.ceil(len(full_list) / pagesize)
         full_list = full_list[(page - 1) * pagesize:page * pagesize]
@@ -240,14 +250,15 @@ async def ajax_list_subcorpora(amodel: UserActionModel, req: KRequest, resp: KRe
 @http_action(access_level=2, return_type='json', action_model=UserActionModel)
 async def delete(amodel: UserActionModel, req: KRequest, resp: KResponse) -> Dict[str, Any]:
     num_wiped = 0
+    subc_dir = settings.get('corpora', 'subcorpora_dir')
     with plugins.runtime.SUBC_STORAGE as sr, plugins.runtime.USER_ITEMS as ui:
         user_items = {x.subcorpus_id: x.ident for x in (await ui.get_user_items(amodel.plugin_ctx))}
         for item in req.json['items']:
             await sr.delete_query(amodel.session_get('user', 'id'), item['corpname'], item['subcname'])
             try:
                 subc = await amodel.cf.get_corpus(await sr.get_info(item['subcname']))
-                os.unlink(os.path.join(settings.get('corpora', 'subcorpora_dir'),
-                                       subc.portable_ident.data_path))
+                # the storage may be a slow network one so we keep the event loop free
+                await as_async(os.unlink)(os.path.join(subc_dir, subc.portable_ident.data_path))
                 if item['subcname'] in user_items:
                     await ui.delete_user_item(amodel.plugin_ctx, user_items[item['subcname']])
             except (CorpusInstantiationError, IOError) as e:
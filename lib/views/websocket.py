@@ -15,6 +15,7 @@
 import asyncio
 from typing import Type, TypeVar, Optional
 
+import orjson
 import settings
 import ujson as json
 from action.krequest import KRequest
@@ -23,6 +24,7 @@ from action.model.abstract import AbstractPageModel, AbstractUserModel
 from action.model.concordance import ConcActionModel
 from action.model.user import UserActionModel
 from action.props import ActionProps
+from action.templating import custom_json_default
 from sanic import Blueprint, Request, Sanic, Websocket
 from views.concordance import _get_conc_cache_status
 from views.root import _check_task_status
@@ -81,7 +83,9 @@ async def _prepare_websocket_amodel(req: Request, ws: Websocket, amodel: Type[T]
 async def _send_status(amodel, task_id: str, ws: Websocket) -> Optional[AsyncTaskStatus]:
     task = await _check_task_status(amodel, task_id)
     if task:
-        await ws.send(json.dumps(task.to_dict()))
+        # task args are free-form so the encoding must be as lenient as in JSON action responses
+        await ws.send(orjson.dumps(
+            task, default=custom_json_default, option=orjson.OPT_NON_STR_KEYS).decode())
     else:
         await ws.close(reason=f'task {task_id} not found')
     return task
@@ -52,6 +52,8 @@ LOCALE_PATH = os.path.realpath(os.path.join(os.path.dirname(__file__), '../local
 JWT_COOKIE_NAME = 'kontext_jwt'
 JWT_ALGORITHM = 'HS256'
 DFLT_HTTP_CLIENT_TIMEOUT = 20
+# how long idle connections of the shared HTTP client are kept open for reuse
+HTTP_CLIENT_KEEPALIVE_SECS = 60
 # a file for storing soft-reset token (the stored value is auto-generated on each (re)start)
 SOFT_RESET_TOKEN_FILE = os.path.join(
     tempfile.gettempdir(), 'kontext_srt', hashlib.sha1(CONF_PATH.encode()).hexdigest())
@@ -195,7 +197,8 @@ async def main_process_init(*_):
 async def server_init(app: Sanic, loop: asyncio.BaseEventLoop):
     setproctitle(f'sanic-kontext [{CONF_PATH}][worker]')
     # init extensions fabrics
-    app.ctx.client_session = aiohttp.ClientSession()
+    app.ctx.client_session = aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(keepalive_timeout=HTTP_CLIENT_KEEPALIVE_SECS))
     # runtime conf (this should have its own module in the future)
     http_client_conf = settings.get_int('global', 'http_client_timeout_secs', 0)
     if not http_client_conf:
@@ -215,6 +218,10 @@ async def server_init(app: Sanic, loop: asyncio.BaseEventLoop):
 @application.listener('after_server_stop')
 async def server_init(app: Sanic, loop: asyncio.BaseEventLoop):
     await app.ctx.client_session.close()
+    for p in plugins.runtime:
+        fn = getattr(p.instance, 'on_server_stop', None)
+        if callable(fn):
+            await fn()
 
 
 @application.middleware('request')
@@ -1,26 +1,17 @@
 from lxml import etree
-import sys
 import json
 import os
 import codecs
 
 
 def process_document(xml_doc, single_upd=None):
-    def func_name(j): return 'update_%d' % j
-
     if single_upd is not None:
-        fn = getattr(sys.modules[__name__], func_name(single_upd))
-        if callable(fn):
-            fn(xml_doc)
-        else:
+        if not 1 <= single_upd <= len(_UPDATES):
             raise Exception('ERROR: update %s not found' % single_upd)
+        _UPDATES[single_upd - 1](xml_doc)
     else:
-        i = 1
-        while func_name(i) in dir(sys.modules[__name__]):
-            fn = getattr(sys.modules[__name__], func_name(i))
-            if callable(fn):
-                fn(xml_doc)
-            i += 1
+        for fn in _UPDATES:
+            fn(xml_doc)
 
 
 def update_1(doc):
@@ -116,6 +107,9 @@ def update_9(doc):
     mod_elm.tail = '\n        '
 
 
+_UPDATES = (update_1, update_2, update_3, update_4, update_5, update_6, update_7, update_8, update_9)
+
+
 if __name__ == '__main__':
     import argparse
     argparser = argparse.ArgumentParser(description='Upgrade KonText config.xml version 0.9.x/0.10.x '
@@ -126,18 +120,19 @@ if __name__ == '__main__':
                            help='Perform a single update (identified by a number)')
     argparser.add_argument('-p', '--print', action='store_const', const=True,
                            help='Print result instead of writing it to a file')
+    argparser.add_argument('--no-pretty', action='store_true',
+                           help='Do not pretty-print the result (faster for large files)')
     args = argparser.parse_args()
 
     doc = etree.parse(args.conf_file)
     process_document(doc, getattr(args, 'update'))
 
-    result_xml = etree.tostring(doc, encoding='utf-8', pretty_print=True)
     if getattr(args, 'print'):
-        print(result_xml)
+        print(etree.tostring(doc, encoding='utf-8', pretty_print=not args.no_pretty))
     else:
         output_path = '%s.new.xml' % args.conf_file.rsplit('.', 1)[0]
-        with open(output_path, 'wb') as f:
-            f.write(result_xml)
-            print(('DONE!\nConverted config written to %s\n' % output_path))
+        # the document is serialized directly to the file (without an intermediate buffer)
+        doc.write(output_path, encoding='utf-8', pretty_print=not args.no_pretty)
+        print(('DONE!\nConverted config written to %s\n' % output_path))
     print('\nPlease do not forget to update subcorpora paths by running updsubc.py!\n')
     print('\nPlease do not forget to update user_index by running upd_user_index.py!\n')
@@ -1,29 +1,28 @@
-import sys
-
 from lxml import etree
 
+# note: the former doc.find('/plugins/...') calls were evaluated relative to the root element
+# so the (absolute) XPath equivalents must skip the root element explicitly
+_FIND_QUERY_STORAGE = etree.XPath('/*/plugins/query_storage')
+_FIND_CONC_PERSISTENCE = etree.XPath('/*/plugins/conc_persistence')
+_FIND_EXTENSION_BY = etree.XPath('/*/plugins/*/*[@extension-by]')
+_FIND_COLLS_CACHE_MIN_LINES = etree.XPath('/*/corpora/colls_cache_min_lines')
+_FIND_SUBC_RESTORE = etree.XPath('/*/plugins/subc_restore')
 
-def process_document(xml_doc, single_upd=None):
-    def func_name(j): return 'update_%d' % j
 
+def process_document(xml_doc, single_upd=None):
     if single_upd is not None:
-        fn = getattr(sys.modules[__name__], func_name(single_upd))
-        if callable(fn):
-            fn(xml_doc)
-        else:
+        if not 1 <= single_upd <= len(_UPDATES):
             raise Exception('ERROR: update %s not found' % single_upd)
+        _UPDATES[single_upd - 1](xml_doc)
     else:
-        i = 1
-        while func_name(i) in dir(sys.modules[__name__]):
-            fn = getattr(sys.modules[__name__], func_name(i))
-            if callable(fn):
-                fn(xml_doc)
-            i += 1
+        for fn in _UPDATES:
+            fn(xml_doc)
 
 
 def update_1(doc):
-    qh = doc.find('/plugins/query_storage')
-    if qh is not None:
+    srch = _FIND_QUERY_STORAGE(doc)
+    if srch:
+        qh = srch[0]
         qh.tag = 'query_history'
 
         srch = qh.find('module')
@@ -36,8 +35,9 @@ def update_1(doc):
 
 
 def update_2(doc):
-    qh = doc.find('/plugins/conc_persistence')
-    if qh is not None:
+    srch = _FIND_CONC_PERSISTENCE(doc)
+    if srch:
+        qh = srch[0]
         qh.tag = 'query_persistence'
 
         srch = qh.find('module')
@@ -51,23 +51,22 @@ def update_2(doc):
 
 
 def update_3(doc):
-    plugins = doc.find('/plugins')
-    for plugin in plugins:
-        for element in plugin:
-            if 'extension-by' in element.attrib:
-                del element.attrib['extension-by']
+    for element in _FIND_EXTENSION_BY(doc):
+        del element.attrib['extension-by']
 
 
 def update_4(doc):
-    srch = doc.find('/corpora/colls_cache_min_lines')
-    if srch is not None:
+    for srch in _FIND_COLLS_CACHE_MIN_LINES(doc):
         srch.getparent().remove(srch)
 
 
 def update_5(doc):
-    srch = doc.find('plugins/subc_restore')
-    if srch is not None:
-        srch.text = 'subc_storage'
+    srch = _FIND_SUBC_RESTORE(doc)
+    if srch:
+        srch[0].text = 'subc_storage'
+
+
+_UPDATES = (update_1, update_2, update_3, update_4, update_5)
 
 
 if __name__ == '__main__':
@@ -80,16 +79,17 @@ if __name__ == '__main__':
                            help='Perform a single update (identified by a number)')
     argparser.add_argument('-p', '--print', action='store_const', const=True,
                            help='Print result instead of writing it to a file')
+    argparser.add_argument('--no-pretty', action='store_true',
+                           help='Do not pretty-print the result (faster for large files)')
     args = argparser.parse_args()
 
     doc = etree.parse(args.conf_file)
     process_document(doc, getattr(args, 'update'))
 
-    result_xml = etree.tostring(doc, encoding='utf-8', pretty_print=True)
     if getattr(args, 'print'):
-        print(result_xml)
+        print(etree.tostring(doc, encoding='utf-8', pretty_print=not args.no_pretty))
     else:
         output_path = '{}.new.xml'.format(args.conf_file.rsplit('.', 1)[0])
-        with open(output_path, 'wb') as f:
-            f.write(result_xml)
-            print(('DONE!\nConverted config written to %s\n' % output_path))
+        # the document is serialized directly to the file (without an intermediate buffer)
+        doc.write(output_path, encoding='utf-8', pretty_print=not args.no_pretty)
+        print(('DONE!\nConverted config written to %s\n' % output_path))
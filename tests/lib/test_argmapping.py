@@ -0,0 +1,80 @@
+# Copyright (c) 2023 Charles University, Faculty of Arts,
+#                    Institute of the Czech National Corpus
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; version 2
+# dated June, 1991.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+import unittest
+from dataclasses import dataclass, field
+from types import SimpleNamespace
+from typing import List
+
+from action.argmapping.action import (
+    IntOpt, ListIntOpt, StrOpt, create_mapped_args)
+from action.errors import UserReadableException
+from sanic.request import RequestParameters
+
+
+@dataclass
+class MappedArgs:
+    name: str
+    size: int
+    tags: List[str]
+    note: StrOpt = None
+    limit: IntOpt = None
+    ids: ListIntOpt = field(default_factory=list)
+
+
+def mk_request(args=None, form=None):
+    return SimpleNamespace(args=RequestParameters(args or {}), form=RequestParameters(form or {}))
+
+
+class CreateMappedArgsTest(unittest.TestCase):
+
+    def test_args(self):
+        req = mk_request(args=dict(name=['foo'], size=['3'], tags=['a', 'b'], ids=['1', '2']))
+        ans = create_mapped_args(MappedArgs, req)
+        self.assertEqual(ans, MappedArgs(name='foo', size=3, tags=['a', 'b'], ids=[1, 2]))
+
+    def test_form_fallback(self):
+        req = mk_request(
+            args=dict(name=['foo']),
+            form=dict(size=['3'], tags=['abc'], note=['a note'], limit=['10']))
+        ans = create_mapped_args(MappedArgs, req)
+        self.assertEqual(
+            ans, MappedArgs(name='foo', size=3, tags=['abc'], note='a note', limit=10))
+
+    def test_args_take_precedence_over_form(self):
+        req = mk_request(
+            args=dict(name=['foo'], size=['3'], tags=['a']),
+            form=dict(name=['bar'], tags=['b', 'c']))
+        ans = create_mapped_args(MappedArgs, req)
+        self.assertEqual(ans.name, 'foo')
+        self.assertEqual(ans.tags, ['a'])
+
+    def test_multi_char_form_value_is_single_valued(self):
+        req = mk_request(form=dict(name=['foobar'], size=['12'], tags=['x']))
+        ans = create_mapped_args(MappedArgs, req)
+        self.assertEqual(ans.name, 'foobar')
+        self.assertEqual(ans.size, 12)
+
+    def test_missing_argument(self):
+        req = mk_request(args=dict(name=['foo'], tags=['a']))
+        with self.assertRaises(UserReadableException):
+            create_mapped_args(MappedArgs, req)
+
+    def test_multi_valued_form_argument(self):
+        req = mk_request(form=dict(name=['foo', 'bar'], size=['1'], tags=['a']))
+        with self.assertRaises(UserReadableException):
+            create_mapped_args(MappedArgs, req)
+
+
+if __name__ == '__main__':
+    unittest.main()
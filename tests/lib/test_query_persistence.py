@@ -0,0 +1,31 @@
+# Copyright (c) 2023 Charles University, Faculty of Arts,
+#                    Institute of the Czech National Corpus
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; version 2
+# dated June, 1991.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+import unittest
+
+from plugin_types.query_persistence.common import generate_idempotent_id
+
+
+class IdempotentIdTest(unittest.TestCase):
+
+    def test_id_is_stable(self):
+        # IDs of already stored queries must not change between versions
+        data = {'q': ['aword,[lemma="test"]'], 'corpora': ['syn2020']}
+        self.assertEqual(generate_idempotent_id(data), 'tqYuKCKwCCsC')
+
+    def test_same_data_same_id(self):
+        self.assertEqual(generate_idempotent_id({'q': ['x']}), generate_idempotent_id({'q': ['x']}))
+
+
+if __name__ == '__main__':
+    unittest.main()
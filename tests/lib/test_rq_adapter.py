@@ -0,0 +1,75 @@
+# Copyright (c) 2023 Charles University, Faculty of Arts,
+#                    Institute of the Czech National Corpus
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; version 2
+# dated June, 1991.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+import asyncio
+import threading
+import unittest
+
+from bgcalc.adapter.rq import ResultWrapper
+
+
+class MockJob:
+    """
+    A job which becomes finished after a specified number of status checks
+    and which records threads the status checks were performed in.
+    """
+
+    def __init__(self, finish_after: int, status='queued'):
+        self._finish_after = finish_after
+        self._status = status
+        self.id = 'job1'
+        self.result = 'the result'
+        self.status_calls = []
+        self.check_threads = set()
+
+    @property
+    def is_finished(self):
+        self.check_threads.add(threading.get_ident())
+        self._finish_after -= 1
+        return self._finish_after <= 0
+
+    @property
+    def is_failed(self):
+        return False
+
+    def get_status(self, refresh=True):
+        self.status_calls.append(refresh)
+        return self._status
+
+
+class ResultWrapperTest(unittest.IsolatedAsyncioTestCase):
+
+    async def test_get_finished(self):
+        job = MockJob(finish_after=1)
+        self.assertEqual(await ResultWrapper(job).get(), 'the result')
+        self.assertNotIn(threading.get_ident(), job.check_threads)
+
+    async def test_get_timeout(self):
+        job = MockJob(finish_after=100)
+        ans = await ResultWrapper(job).get(timeout=0.5)
+        self.assertIsInstance(ans, Exception)
+
+    async def test_get_can_be_cancelled_by_wait_for(self):
+        with self.assertRaises(asyncio.TimeoutError):
+            await asyncio.wait_for(ResultWrapper(MockJob(finish_after=100)).get(), timeout=0.7)
+
+    def test_status_of_fresh_job_is_not_refetched(self):
+        job = MockJob(finish_after=1, status='started')
+        wrapper = ResultWrapper(job, fresh=True)
+        self.assertEqual(wrapper.status, 'STARTED')
+        self.assertEqual(wrapper.status, 'STARTED')
+        self.assertEqual(job.status_calls, [False, True])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,80 @@
+# Copyright (c) 2023 Charles University, Faculty of Arts,
+#                    Institute of the Czech National Corpus
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; version 2
+# dated June, 1991.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+import unittest
+from dataclasses import dataclass
+from typing import NamedTuple
+
+import orjson
+from action.templating import custom_json_default
+from bgcalc.task import AsyncTaskStatus
+from dataclasses_json import dataclass_json
+
+# the same options as used by action.control for JSON responses
+JSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATACLASS
+
+
+class ValuePair(NamedTuple):
+    id: str
+    label: str
+
+
+@dataclass
+class PlainItem:
+    name: str
+    pair: ValuePair
+
+
+@dataclass_json
+@dataclass
+class JsonItem:
+    name: str
+    size: int
+
+
+def dumps(data):
+    return orjson.loads(orjson.dumps(data, default=custom_json_default, option=JSON_OPTIONS))
+
+
+class CustomJsonDefaultTest(unittest.TestCase):
+
+    def test_named_tuple_list(self):
+        data = dict(bib_data=[ValuePair('1', 'foo'), ValuePair('2', 'bar')])
+        self.assertEqual(dumps(data), dict(bib_data=[['1', 'foo'], ['2', 'bar']]))
+
+    def test_plain_dataclass(self):
+        self.assertEqual(
+            dumps(PlainItem('x', ValuePair('1', 'foo'))), dict(name='x', pair=['1', 'foo']))
+
+    def test_dataclass_json(self):
+        self.assertEqual(dumps([JsonItem('x', 10)]), [dict(name='x', size=10)])
+
+    def test_non_str_keys(self):
+        self.assertEqual(dumps({1: 'a'}), {'1': 'a'})
+
+    def test_unsupported_type(self):
+        with self.assertRaises(TypeError):
+            orjson.dumps(object(), default=custom_json_default, option=JSON_OPTIONS)
+
+    def test_async_task_status_free_form_args(self):
+        # encoded in the same way the websocket task status view does
+        task = AsyncTaskStatus(
+            ident='t1', label='foo', status='PENDING', category='subcorpus',
+            args={1: 'a', 'pair': ValuePair('1', 'foo')}, created=1.0)
+        data = orjson.loads(orjson.dumps(task, default=custom_json_default, option=orjson.OPT_NON_STR_KEYS))
+        self.assertEqual(data['args'], {'1': 'a', 'pair': ['1', 'foo']})
+        self.assertEqual(data['ident'], 't1')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,78 @@
+# Copyright (c) 2023 Charles University, Faculty of Arts,
+#                    Institute of the Czech National Corpus
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; version 2
+# dated June, 1991.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+import hashlib
+import unittest
+
+from util import TTLCache, int2chash
+
+
+class Int2ChashTest(unittest.TestCase):
+    """
+    The int2chash output is used for stored (idempotent) query IDs
+    so the values below must never change.
+    """
+
+    def test_md5_based_id(self):
+        self.assertEqual(
+            int2chash(int.from_bytes(hashlib.md5(b'foo').digest(), 'big'), 12), 'oO6AiQ4YC2qu')
+
+    def test_large_number(self):
+        self.assertEqual(int2chash(2 ** 100 + 12345, 12), 'N0IMA4AWLaZB')
+
+    def test_small_number(self):
+        self.assertEqual(int2chash(123456789, 12), 'HUawi')
+
+    def test_zero(self):
+        self.assertEqual(int2chash(0, 12), '')
+
+    def test_length_limit(self):
+        self.assertEqual(int2chash(2 ** 100 + 12345, 4), 'N0IM')
+
+
+class TTLCacheTest(unittest.TestCase):
+
+    def test_get_set(self):
+        cache = TTLCache(max_size=10, ttl=100)
+        cache.set('a', 1)
+        self.assertEqual(cache.get('a'), 1)
+        self.assertIsNone(cache.get('b'))
+
+    def test_expired_item(self):
+        cache = TTLCache(max_size=10, ttl=-1)
+        cache.set('a', 1)
+        self.assertIsNone(cache.get('a'))
+
+    def test_least_recently_used_is_evicted(self):
+        cache = TTLCache(max_size=2, ttl=100)
+        cache.set('a', 1)
+        cache.set('b', 2)
+        cache.get('a')
+        cache.set('c', 3)
+        self.assertEqual(cache.get('a'), 1)
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual(cache.get('c'), 3)
+
+    def test_remove_if(self):
+        cache = TTLCache(max_size=10, ttl=100)
+        cache.set((1, 'x'), 'a')
+        cache.set((1, 'y'), 'b')
+        cache.set((2, 'x'), 'c')
+        cache.remove_if(lambda k: k[0] == 1)
+        self.assertIsNone(cache.get((1, 'x')))
+        self.assertIsNone(cache.get((1, 'y')))
+        self.assertEqual(cache.get((2, 'x')), 'c')
+
+
+if __name__ == '__main__':
+    unittest.main()
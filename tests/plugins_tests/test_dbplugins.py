@@ -22,8 +22,10 @@ Test parameters allow to turn on/off the verbose mode and the ttl methods testin
 The sqlite3 plugin stores data in a single table called "data" with the following structure:
 CREATE TABLE data (key text PRIMARY KEY, value text, expires integer)
 """
+import json
 import os
 import sqlite3
+import tempfile
 import time
 import unittest
 
@@ -83,6 +85,20 @@ class DbTest(unittest.IsolatedAsyncioTestCase):
         out_s = await self.s.get(key)
         self.assertEqual(out_r, out_s)
 
+    async def test_get_raw(self):
+        """
+        test the get_raw method - the returned JSON must encode the stored data only
+        """
+        key = 'foo'
+        value = {'bar': [1, 2], 'cheese': 2.5}
+        await self.r.set(key, value)
+        await self.s.set(key, value)
+        out_r = await self.r.get_raw(key)
+        out_s = await self.s.get_raw(key)
+        self.assertTrue(json.loads(out_r) == json.loads(out_s) == value)
+        self.assertIsNone(await self.r.get_raw('missing'))
+        self.assertIsNone(await self.s.get_raw('missing'))
+
     async def test_list_get_and_list_append(self):
         """
         test the list_append and list_get methods
@@ -99,6 +115,22 @@ class DbTest(unittest.IsolatedAsyncioTestCase):
         out_s = await self.s.list_get(key)
         self.assertTrue(out_r == out_s == check_list)
 
+    async def test_list_append_many(self):
+        """
+        test the list_append_many method (including an empty list of values)
+        """
+        key = 'list'
+        check_list = [0, 'foo', {'bar': 1}]
+        await self.r.list_append(key, 'first')
+        await self.s.list_append(key, 'first')
+        await self.r.list_append_many(key, check_list)
+        await self.s.list_append_many(key, check_list)
+        await self.r.list_append_many(key, [])
+        await self.s.list_append_many(key, [])
+        out_r = await self.r.list_get(key)
+        out_s = await self.s.list_get(key)
+        self.assertTrue(out_r == out_s == ['first'] + check_list)
+
     async def test_list_get_with_range(self):
         """
         test the list_append and list_get methods
@@ -498,6 +530,22 @@ class DbTest(unittest.IsolatedAsyncioTestCase):
         self.assertTrue(isinstance(await self.r.get_instance(1), KeyValueStorage))
         self.assertTrue(isinstance(await self.s.get_instance(1), KeyValueStorage))
 
+    async def test_sqlite_close(self):
+        """
+        test that closing the sqlite3 plugin keeps the data and that the plugin
+        reopens the connection on the next operation
+        """
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            db = DefaultDb(os.path.join(tmp_dir, 'test.db'))
+            async with db.connection() as conn:
+                await conn.execute(CREATE_DATA_TABLE_SQL)
+                await conn.commit()
+            await db.set('foo', ['bar', 1])
+            await db.on_server_stop()
+            await db.close()  # closing an already closed plugin must be harmless
+            self.assertEqual(await db.get('foo'), ['bar', 1])
+            await db.close()
+
 
 if __name__ == '__main__':
     unittest.main()
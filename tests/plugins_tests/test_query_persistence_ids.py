@@ -0,0 +1,56 @@
+# Copyright (c) 2023 Charles University, Faculty of Arts,
+#                    Institute of the Czech National Corpus
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; version 2
+# dated June, 1991.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+"""
+Contains unittests for the is_valid_id method of the query_persistence plugins.
+"""
+import unittest
+
+from mocks.storage import TestingKeyValueStorage
+from plugins.default_query_persistence import DefaultQueryPersistence, DbPluginArchBackend
+from plugins.mysql_query_persistence import MySqlQueryPersistence
+from plugins.stable_query_persistence import StableQueryPersistence
+
+VALID_IDS = ('~abcXYZ09', '~0', '~tqYuKCKwCCsC')
+INVALID_IDS = ('abc', '~', '~~abc', '~abc/def', '~abc!!!', '~abc\n', ' ~abc', '~abc ')
+
+
+class MockSettings:
+
+    def get(self, section, key):
+        return dict(archive_queue_key='conc_arch_queue')
+
+
+class IsValidIdTest(unittest.TestCase):
+
+    def setUp(self):
+        db = TestingKeyValueStorage({})
+        self.plugins = (
+            DefaultQueryPersistence(db, None, 1, 1, DbPluginArchBackend(db, 1, 1)),
+            MySqlQueryPersistence(MockSettings(), db, None, None),
+            StableQueryPersistence(db, MockSettings()),
+        )
+
+    def test_valid_ids(self):
+        for plugin in self.plugins:
+            for data_id in VALID_IDS:
+                self.assertTrue(plugin.is_valid_id(data_id), f'{type(plugin).__name__}: {data_id!r}')
+
+    def test_invalid_ids(self):
+        for plugin in self.plugins:
+            for data_id in INVALID_IDS:
+                self.assertFalse(plugin.is_valid_id(data_id), f'{type(plugin).__name__}: {data_id!r}')
+
+
+if __name__ == '__main__':
+    unittest.main()